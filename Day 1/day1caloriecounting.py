@@ -40,22 +40,101 @@ In case the Elves get hungry and need extra snacks, they need to know which Elf
 Find the Elf carrying the most Calories. How many total Calories is that Elf carrying?
  """
 
-with open('Day 1 - input.txt') as f:
-    lines = f.readlines()
-
-elves = []
-current_sum = 0
-max_calory = 0
-
-for l in lines:
-    if l == '\n':
-        max_calory = max(max_calory, current_sum)
-        elves.append(current_sum)
-        current_sum = 0
-    else:
-        current_sum += int(l[:-1])
-
-print(max_calory) # Ans: 69836
+import heapq
+
+# How many of the biggest totals to keep. Part 2 needs the top three, so a smaller k keeps three
+# anyway; a bigger one keeps more.
+TOP = 3
+
+# int() on every line is most of the Python path's time, and NumPy makes up for its import at
+# around 2MB of input
+NUMPY_THRESHOLD = 2000000
+
+def parse(text, k=TOP):
+    if len(text) > NUMPY_THRESHOLD:
+        return parse_bytes(text.encode(), k)
+    return parse_groups(groups(text.splitlines()), k)
+
+# Splits the lines into groups at blank lines. splitlines() takes care of Windows line endings, and
+# a line with only spaces on it counts as blank, the same as in aoc2022.chunked.
+def groups(lines):
+    group = []
+    for line in lines:
+        if line.strip() == '':
+            if group:
+                yield group
+            group = []
+        else:
+            group.append(line)
+    if group:
+        yield group
+
+# Each group is the list of lines for one elf. Only the k biggest totals are kept.
+def parse_groups(groups, k=TOP):
+    return top_totals((sum(int(l) for l in group) for group in groups), k)
+
+# Keeps the k biggest totals in a min-heap as they arrive, so memory stays the same however many
+# elves there are. Returns them biggest first.
+def top_totals(totals, k=TOP):
+    k = max(k, TOP)
+    heap = []
+    for total in totals:
+        if len(heap) < k:
+            heapq.heappush(heap, total)
+        elif total > heap[0]:
+            heapq.heapreplace(heap, total)
+
+    return sorted(heap, reverse=True)
+
+# Combines the top totals of several parts of the input, see aoc2022.chunked
+def merge(parts, k=TOP):
+    return top_totals((total for part in parts for total in part), k)
+
+# The whole input at once with NumPy: the lines' values are built a digit column at a time, then
+# np.add.reduceat sums the lines of each group and np.partition picks out the k biggest without
+# sorting the rest.
+def parse_bytes(data, k=TOP):
+    import numpy as np
+
+    k = max(k, TOP)
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    if len(buffer) == 0 or buffer[-1] != ord('\n'):
+        buffer = np.append(buffer, np.uint8(ord('\n')))
+    # Only digits and line endings are read here. Anything else (spaces around a number, a sign, a
+    # stray \r) goes through parse_groups, so both ways read the input the same.
+    others = np.flatnonzero((buffer - ord('0') > 9) & (buffer != ord('\n')))
+    if len(others) and ((buffer[others] != ord('\r')) | (buffer[others + 1] != ord('\n'))).any():
+        return parse_groups(groups(data.decode().splitlines()), k)
+
+    ends = np.flatnonzero(buffer == ord('\n'))
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    # Windows line endings
+    ends -= (buffer[ends - 1] == ord('\r')) & (ends > starts)
+
+    # Every line's value, and any total of them, has to fit in an int64. Python's ints don't run out.
+    longest = int((ends - starts).max())
+    if len(starts) * 10 ** longest >= 2 ** 63:
+        return parse_groups(groups(data.decode().splitlines()), k)
+
+    values = np.zeros(len(starts), dtype=np.int64)
+    for column in range(longest):
+        more = starts + column < ends
+        digits = buffer[np.where(more, starts + column, 0)].astype(np.int64) - ord('0')
+        values = np.where(more, values * 10 + digits, values)
+
+    blank = ends == starts
+    if blank.all():
+        return []
+    # A group starts at every line with something on it that follows a blank line (or the start)
+    first = ~blank & np.concatenate(([True], blank[:-1]))
+    totals = np.add.reduceat(values[~blank], np.flatnonzero(first[~blank]))
+
+    if len(totals) > k:
+        totals = np.partition(totals, len(totals) - k)[len(totals) - k:]
+    return sorted(totals.tolist(), reverse=True)
+
+def part1(elves):
+    return elves[0]
 
 """ --- Part Two ---
 
@@ -67,6 +146,16 @@ In the example above, the top three Elves are the fourth Elf (with 24000 Calorie
 
 Find the top three Elves carrying the most Calories. How many Calories are those Elves carrying in total? """
 
-elves.sort()
-print(sum(elves[-3:])) # Ans: 207968
+def part2(elves):
+    return sum(elves[:3])
+
+def main():
+    with open('Day 1 - input.txt') as f:
+        elves = parse(f.read())
+
+    print(part1(elves)) # Ans: 69836
+    print(part2(elves)) # Ans: 207968
+
+if __name__ == '__main__':
+    main()
 
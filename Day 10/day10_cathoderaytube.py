@@ -187,20 +187,24 @@ The sum of these signal strengths is 13140.
 
 Find the signal strength during the 20th, 60th, 100th, 140th, 180th, and 220th cycles. What is the sum of these six signal strengths? """
 
-with open('Day 10 - input.txt') as f:
-    lines = f.readlines()
+def parse(text):
+    return parse_lines(text.splitlines())
 
-register = [1]
+def parse_lines(lines):
+    register = [1]
 
-for line in lines:
-    split = line.split(' ')
-    if split[0] == 'addx':
-        register.append(register[-1])
-        register.append(register[-1] + int(split[1][:-1]))
-    else:
-        register.append(register[-1])
+    for line in lines:
+        split = line.split(' ')
+        if split[0] == 'addx':
+            register.append(register[-1])
+            register.append(register[-1] + int(split[1]))
+        else:
+            register.append(register[-1])
 
-print(sum([register[n - 1] * n for n in [20, 60, 100, 140, 180, 220]])) # Ans: 11820
+    return register
+
+def part1(register):
+    return sum([register[n - 1] * n for n in [20, 60, 100, 140, 180, 220]])
 
 """ --- Part Two ---
 It seems like the X register controls the horizontal position of a sprite. Specifically, the sprite is 3 pixels wide, and the X register sets the horizontal position of the middle of that sprite. (In this system, there is no such thing as "vertical position": if the sprite's horizontal position puts its pixels where the CRT is currently drawing, then those pixels will be drawn.)
@@ -328,16 +332,27 @@ Render the image given by your program. What eight capital letters appear on you
 def spriteVisible(cycle, X):
     return abs(X - cycle % 40) <= 1
 
-crt = ""
+def part2(register):
+    crt = ""
+
+    for cycle in range(len(register)):
+        if cycle % 40 == 0:
+            crt += '\n'
+
+        if spriteVisible(cycle, register[cycle]):
+            crt += '#'
+        else:
+            crt +='.'
+
+    return crt
 
-for cycle in range(len(register)):
-    if cycle % 40 == 0:
-        crt += '\n'
+def main():
+    with open('Day 10 - input.txt') as f:
+        register = parse(f.read())
 
-    if spriteVisible(cycle, register[cycle]):
-        crt += '#'
-    else:
-        crt +='.'
+    print(part1(register)) # Ans: 11820
+    print(part2(register)) # Ans: EPJBRKAH
 
-print(crt) # Ans: EPJBRKAH
+if __name__ == '__main__':
+    main()
     
@@ -301,40 +301,42 @@ ops = {
     '/': lambda x, y: x//y
     }
 
-monkeys = {}
-operations = {}
-tests = {}
+def parse(text):
+    return parse_groups(group.splitlines() for group in text.split('\n\n') if group.strip())
 
-def parse_input():
-    with open('Day 11 - input.txt') as f:
-        lines = [line.rstrip('\n') for line in f]
+# Each group is the six lines describing one monkey.
+def parse_groups(groups):
+    monkeys = {}
+    operations = {}
+    tests = {}
 
-    for i in range(0, len(lines), 7):
-        index = i // 7
-        item_str = lines[i+1].split(' ')
+    for index, lines in enumerate(groups):
+        item_str = lines[1].split(' ')
         item_str = [item.rstrip(',') for item in item_str]
         monkeys[index] = item_str[4:]
 
-        op_str = lines[i+2].split(' ')
+        op_str = lines[2].split(' ')
         operations[index] = (op_str[-3], op_str[-2], op_str[-1])
 
-        test_str = lines[i+3].split(' ')
-        true_str =  lines[i+4].split(' ')
-        false_str = lines[i+5].split(' ')
+        test_str = lines[3].split(' ')
+        true_str =  lines[4].split(' ')
+        false_str = lines[5].split(' ')
         tests[index] = (int(test_str[-1]), int(true_str[-1]), int(false_str[-1]))
 
-def calculate_worry(index, worry):
+    return monkeys, operations, tests
+
+def calculate_worry(operations, index, worry):
     if operations[index][2] == 'old':
         return eval_string(worry, worry, operations[index][1])
     else:
         return eval_string(worry, operations[index][2], operations[index][1])
 
-def play_round_part1():
+def play_round_part1(monkeys, operations, tests):
     inspections = [0] * len(monkeys)
     for index, worries in monkeys.items():
         for worry in worries.copy():
             worry = worries.pop(0)
-            worry = calculate_worry(index, worry) // 3
+            worry = calculate_worry(operations, index, worry) // 3
 
             if worry % tests[index][0] == 0:
                 monkeys[tests[index][1]].append(worry)
@@ -343,12 +345,12 @@ def play_round_part1():
             inspections[index] += 1
     return inspections
 
-def play_round_part2(lcm):
+def play_round_part2(monkeys, operations, tests, lcm):
     inspections = [0] * len(monkeys)
     for index, worries in monkeys.items():
         for worry in worries.copy():
             worry = worries.pop(0)
-            worry = calculate_worry(index, worry) % lcm
+            worry = calculate_worry(operations, index, worry) % lcm
 
             if worry % tests[index][0] == 0:
                 monkeys[tests[index][1]].append(worry)
@@ -360,21 +362,23 @@ def play_round_part2(lcm):
 def eval_string(x, y, op):
     return ops[op](int(x), int(y))
 
-def main():
-    # Part 1
-    parse_input()
+def part1(parsed):
+    monkeys, operations, tests = parsed
+    # Rounds move items between monkeys, so play on a copy of the starting items
+    monkeys = {index: worries.copy() for index, worries in monkeys.items()}
     rounds = 0
     inspections = [0] * len(monkeys)
     while rounds < 20:
-        add = play_round_part1()
+        add = play_round_part1(monkeys, operations, tests)
         inspections = [a + b for (a, b) in zip(inspections, add)]
         rounds += 1
     inspections.sort()
-    print(inspections[-1] * inspections[-2]) # Part 1 Ans: 101436
+    return inspections[-1] * inspections[-2]
 
-    # Part 2 Change // 3 to % LCM
-    parse_input()
-    inspections = [0] * len(monkeys)
+def part2(parsed):
+    # Change // 3 to % LCM
+    monkeys, operations, tests = parsed
+    monkeys = {index: worries.copy() for index, worries in monkeys.items()}
     lcm = 1
     for i in range(len(monkeys)):
         lcm *= tests[i][0]
@@ -382,11 +386,18 @@ def main():
     rounds = 0
     inspections = [0] * len(monkeys)
     while rounds < 10000:
-        add = play_round_part2(lcm)
+        add = play_round_part2(monkeys, operations, tests, lcm)
         inspections = [a + b for (a, b) in zip(inspections, add)]
         rounds += 1
     inspections.sort()
-    print(inspections[-1] * inspections[-2]) # Part 1 Ans: 19754471646
+    return inspections[-1] * inspections[-2]
+
+def main():
+    with open('Day 11 - input.txt') as f:
+        parsed = parse(f.read())
+
+    print(part1(parsed)) # Part 1 Ans: 101436
+    print(part2(parsed)) # Part 2 Ans: 19754471646
 
 if __name__ == '__main__':
     main()
@@ -50,18 +50,26 @@ This path reaches the goal in only 29 steps, the fewest possible.
 
 What is the fewest steps required to move starting from any square with elevation a to the location that should get the best signal? """
 
-def parse():
-    with open('Day 12 - input.txt') as f:
-        lines = [line.rstrip('\n') for line in f]
-    
+def parse(text):
+    return parse_rows(text.splitlines())
+
+# grid is a 2D array of the input's character codes, e.g. from aoc2022.grid.load_grid. Those
+# codes already are the heights, and the search below is much quicker on lists than on a NumPy array.
+def parse_grid(grid):
+    heights = grid.tolist()
+    start, end = get_end_points(heights)
+    return heights, start, end
+
+def parse_rows(rows):
     heights = []
-    for line in lines:
+    for line in rows:
         row = []
         for char in line:
             row.append(ord(char))
         heights.append(row)
 
-    return heights
+    start, end = get_end_points(heights)
+    return heights, start, end
 
 # Check if its possible to move north
 def checkNorth(row, col, heights):
@@ -164,16 +172,21 @@ def any_starting_a(end, heights):
     
     return shortest_path
 
-def main():
-    # Part 1
-    heights = parse()
-    start, end = get_end_points(heights)
+def part1(parsed):
+    heights, start, end = parsed
     paths = traverse(start, heights)
-    print(len(paths[end])) # Part 1 Ans: 350
+    return len(paths[end])
+
+def part2(parsed):
+    heights, start, end = parsed
+    return any_starting_a(end, heights)
+
+def main():
+    with open('Day 12 - input.txt') as f:
+        parsed = parse(f.read())
+
+    print(part1(parsed)) # Part 1 Ans: 350
+    print(part2(parsed)) # Part 2 Ans: 349
 
-    # Part 2
-    shortest_path_from_any = any_starting_a(end, heights)
-    print(shortest_path_from_any) # Part 2 Ans: 349
-    
 if __name__ == '__main__':
     main()
\ No newline at end of file
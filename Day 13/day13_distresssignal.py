@@ -143,17 +143,20 @@ Organize all of the packets into the correct order. What is the decoder key for
 import json
 from functools import cmp_to_key
 
-def parse():
-    with open('Day 13 - input.txt') as f:
-        lines = [f.rstrip('\n') for f in f]
-
-        left_packets = [json.loads(lines[i]) for i in range(0, len(lines), 3)]
-        right_packets = [json.loads(lines[i]) for i in range(1, len(lines), 3)]
-        all_packets = [json.loads(lines[i]) for i in range(len(lines)) if i % 3 != 2]
-        all_packets.append([2])
-        all_packets.append([6])
-        all_packets = sorted(all_packets, key=cmp_to_key(compare_order))
-        return left_packets, right_packets, all_packets
+def parse(text):
+    return parse_lines(text.splitlines())
+
+def parse_lines(lines):
+    left_packets = []
+    right_packets = []
+    for line in lines:
+        if line == '':
+            continue
+        if len(left_packets) == len(right_packets):
+            left_packets.append(json.loads(line))
+        else:
+            right_packets.append(json.loads(line))
+    return left_packets, right_packets
 
 """ def compare_order(left, right):
   if left == []:
@@ -211,10 +214,24 @@ def get_ordered_pairs(left_packets, right_packets):
             
     return ordered_pairs
 
+def part1(parsed):
+    left_packets, right_packets = parsed
+    return sum(get_ordered_pairs(left_packets, right_packets))
+
+def part2(parsed):
+    left_packets, right_packets = parsed
+    all_packets = [packet for pair in zip(left_packets, right_packets) for packet in pair]
+    all_packets.append([2])
+    all_packets.append([6])
+    all_packets = sorted(all_packets, key=cmp_to_key(compare_order))
+    return (all_packets.index([2]) + 1) * (all_packets.index([6]) + 1)
+
 def main():
-    left_packets, right_packets, all_packets = parse()
-    print(sum(get_ordered_pairs(left_packets, right_packets))) # Part 1 Ans: 6369
-    print((all_packets.index([2]) + 1) * (all_packets.index([6]) + 1)) # Part 2 Ans: 25800
+    with open('Day 13 - input.txt') as f:
+        parsed = parse(f.read())
+
+    print(part1(parsed)) # Part 1 Ans: 6369
+    print(part2(parsed)) # Part 2 Ans: 25800
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
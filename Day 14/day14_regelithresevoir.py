@@ -149,10 +149,10 @@ Using your scan, simulate the falling sand until the source of the sand becomes
 
 import numpy as np
 
-def parse():
-    with open('Day 14 - input.txt') as f:
-        lines = [line.rstrip('\n') for line in f]
+def parse(text):
+    return parse_lines(text.splitlines())
 
+def parse_lines(lines):
     rocks = []
     min_x = float('inf')
     max_x = 0 
@@ -173,7 +173,7 @@ def parse():
 
         rocks.append(rock_structure)
     
-    return max_x - min_x, max_y, min_x, (0, 500 - min_x), rocks
+    return max_x - min_x, max_y, min_x, (0, 500 - min_x), connect_rocks(rocks)
 
 # Add points to connect the rock points together.
 def connect_rocks(rocks):
@@ -305,21 +305,25 @@ def print_scan(scan):
         str += ' '.join(scan[i,:]) + '\n'
     print(str)
 
-def main1():
-    x_range, y_range, min_x, sand, rocks = parse()
-    rocks = connect_rocks(rocks)
+def part1(parsed):
+    x_range, y_range, min_x, sand, rocks = parsed
     scan = scan_cave(x_range, y_range, min_x, sand, rocks)
     scan = simulate_sand(scan, sand)
-    print(np.count_nonzero(scan == 'o')) # Part 1 Ans: 832
+    return int(np.count_nonzero(scan == 'o'))
 
-def main2():
-    x_range, y_range, min_x, sand, rocks = parse()
-    rocks = connect_rocks(rocks)
+def part2(parsed):
+    x_range, y_range, min_x, sand, rocks = parsed
     scan = scan_cave(x_range, y_range, min_x, sand, rocks)
     scan = add_floor(scan, x_range)
     scan = simulate_sand2(scan, sand, y_range)
-    print(np.count_nonzero(scan == 'o')) # Part 2 Ans: 27601
+    return int(np.count_nonzero(scan == 'o'))
+
+def main():
+    with open('Day 14 - input.txt') as f:
+        parsed = parse(f.read())
+
+    print(part1(parsed)) # Part 1 Ans: 832
+    print(part2(parsed)) # Part 2 Ans: 27601
 
 if __name__ == '__main__':
-    main1()
-    main2()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -94,23 +94,21 @@ In this example, in the row where y=10, there are 26 positions where a beacon ca
 
 Consult the report from the sensors you just deployed. In the row where y=2000000, how many positions cannot contain a beacon? """
 
-import numpy as np
+def parse(text):
+    return parse_lines(text.splitlines())
 
-def parse():
-    with open('Day 15 - input.txt') as f:
-        lines = [line.rstrip('\n') for line in f]
-
-        sensors = {}
+def parse_lines(lines):
+    sensors = {}
 
-        for line in lines:
-            split = line.split(' ')
-            sensor_x = int(split[2][2:-1])
-            sensor_y = int(split[3][2:-1])
-            beacon_x = int(split[8][2:-1])
-            beacon_y = int(split[9][2:])
-            sensors[(sensor_x, sensor_y)] = (beacon_x, beacon_y)
+    for line in lines:
+        split = line.split(' ')
+        sensor_x = int(split[2][2:-1])
+        sensor_y = int(split[3][2:-1])
+        beacon_x = int(split[8][2:-1])
+        beacon_y = int(split[9][2:])
+        sensors[(sensor_x, sensor_y)] = (beacon_x, beacon_y)
 
-        return sensors
+    return sensors
 
 def manhattan_distance(start, end):
     return abs(end[0] - start[0]) + abs(end[1] - start[1])
@@ -181,14 +179,43 @@ def n_pos_no_beacon(row):
     row = [char for char in row if char != 'S']
     return len(row)
 
-def main():
-    sensors = parse()
+def part1(sensors, y=2000000):
     row, x_range, x_min, y_min = init_row(sensors)
     # print_map(map)
     # print_row(map[10 + abs(y_min), :], x_min)
-    row = no_beacon(row, sensors, x_range, x_min, 2000000)
+    row = no_beacon(row, sensors, x_range, x_min, y)
     # print_row(row, x_min)
-    print(n_pos_no_beacon(row)) # Part 1 Ans: 5127797
+    return n_pos_no_beacon(row)
+
+# Part 2: the distress beacon is the only position in 0..limit on both axes that no sensor
+# covers. It has to sit just outside the edge of some sensor ranges, so it is found where
+# the diagonal borders (one step past each range) of two sensors cross.
+def part2(sensors, limit=4000000):
+    rising = set()
+    falling = set()
+    for sensor, beacon in sensors.items():
+        distance = manhattan_distance(sensor, beacon) + 1
+        rising.add(sensor[1] - sensor[0] + distance)
+        rising.add(sensor[1] - sensor[0] - distance)
+        falling.add(sensor[1] + sensor[0] + distance)
+        falling.add(sensor[1] + sensor[0] - distance)
+
+    for a in rising:
+        for b in falling:
+            if (b - a) % 2 != 0:
+                continue
+            point = ((b - a) // 2, (a + b) // 2)
+            if not (0 <= point[0] <= limit and 0 <= point[1] <= limit):
+                continue
+            if not any(in_range(sensor, beacon, point) for sensor, beacon in sensors.items()):
+                return point[0] * 4000000 + point[1]
+
+def main():
+    with open('Day 15 - input.txt') as f:
+        sensors = parse(f.read())
+
+    print(part1(sensors)) # Part 1 Ans: 5127797
+    print(part2(sensors)) # Part 2 Ans: 12518502636475
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
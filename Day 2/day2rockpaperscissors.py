@@ -28,11 +28,6 @@ In this example, if you were to follow the strategy guide, you would get a total
 
 What would your total score be if everything goes exactly according to your strategy guide? """
 
-with open('Day 2 - input.txt') as f:
-    lines = f.readlines()
-
-total_score = 0
-
 # Win:  X > C, Y > A, Z > B
 # Lose: X < B, Y < C, Z < A
 # Draw: X = A, Y = B, Z = C
@@ -53,27 +48,52 @@ def choiceScore(A):
     else:
         return 3
 
-for l in lines:
-    you = l[2]
-    opponent = l[0]
-    
-    if you == 'X':
-        you = 'rock'
-    elif you == 'Y':
-        you = 'paper'
-    else:
-        you = 'scissors'
-
-    if opponent == 'A':
-        opponent = 'rock'
-    elif opponent == 'B':
-        opponent = 'paper'
-    else:
-        opponent = 'scissors'
-
-    total_score += choiceScore(you) + outcomeScore(you, opponent)
-
-print(total_score) # Ans: 13268
+from collections import Counter
+
+# The Counter only ever sees nine different lines, so the Python path is already quick and NumPy
+# needs around 2MB of input to make up for its import
+NUMPY_THRESHOLD = 2000000
+
+# A round is all there is to a line, so an input comes down to how many times each of the nine
+# rounds comes up.
+def parse(text):
+    if len(text) > NUMPY_THRESHOLD:
+        return parse_bytes(text.encode())
+    return parse_lines(text.splitlines())
+
+def parse_lines(lines):
+    counts = Counter(lines)
+    del counts['']
+    return counts
+
+# Every round takes up the same four bytes, so the opponents and columns are every fourth byte
+# and np.bincount counts the rounds in one go. Anything else (Windows line endings, stray blank
+# lines) is counted line by line instead.
+def parse_bytes(data):
+    import numpy as np
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    if len(buffer) % 4 == 3:
+        buffer = np.append(buffer, np.uint8(ord('\n')))
+    if len(buffer) % 4 != 0:
+        return parse_lines(data.decode().splitlines())
+    rounds = buffer.reshape(-1, 4)
+    opponents = rounds[:, 0] - ord('A')
+    columns = rounds[:, 2] - ord('X')
+    # The letters are unsigned, so anything before A or X wraps around past 2 as well
+    if (opponents > 2).any() or (columns > 2).any() or (rounds[:, 1] != ord(' ')).any() or (rounds[:, 3] != ord('\n')).any():
+        return parse_lines(data.decode().splitlines())
+
+    # SCORES lists the rounds in the same order as their codes
+    counts = np.bincount(opponents * 3 + columns, minlength=9).tolist()
+    return dict(zip(SCORES, counts))
+
+# Each part's total is the rounds' counts times their scores
+def total(counts, part):
+    return sum(count * SCORES[round][part - 1] for round, count in counts.items())
+
+def part1(counts):
+    return total(counts, 1)
 
 """ --- Part Two ---
 
@@ -89,8 +109,6 @@ Now that you're correctly decrypting the ultra top secret strategy guide, you wo
 
 Following the Elf's instructions for the second column, what would your total score be if everything goes exactly according to your strategy guide? """
 
-total_score = 0
-
 def choose(A, outcome):
     if (outcome == 'X' and A == 'rock') or  (outcome == 'Y' and A == 'scissors') or  (outcome == 'Z' and A == 'paper'):
         return 'scissors'
@@ -99,19 +117,30 @@ def choose(A, outcome):
     else:
         return 'rock'
 
-for l in lines:
-    opponent = l[0]
-    outcome = l[2]
+SHAPES = ['rock', 'paper', 'scissors']
 
-    if opponent == 'A':
-        opponent = 'rock'
-    elif opponent == 'B':
-        opponent = 'paper'
-    else:
-        opponent = 'scissors'
+# There are only nine possible rounds, so both parts' score for each of them is worked out once
+# from the rules above.
+def score_table():
+    table = {}
+    for opponent, theirs in zip('ABC', SHAPES):
+        for column, yours in zip('XYZ', SHAPES):
+            chosen = choose(theirs, column)
+            table[opponent + ' ' + column] = (choiceScore(yours) + outcomeScore(yours, theirs),
+                                              choiceScore(chosen) + outcomeScore(chosen, theirs))
+    return table
+
+SCORES = score_table()
+
+def part2(counts):
+    return total(counts, 2)
 
-    you = choose(opponent, outcome)
-    total_score += choiceScore(you) + outcomeScore(you, opponent)
+def main():
+    with open('Day 2 - input.txt') as f:
+        counts = parse(f.read())
 
-print(total_score)
+    print(part1(counts)) # Ans: 13268
+    print(part2(counts)) # Ans: 15508
 
+if __name__ == '__main__':
+    main()
@@ -29,26 +29,114 @@ In the above example, the priority of the item type that appears in both compart
 
 Find the item type that appears in both compartments of each rucksack. What is the sum of the priorities of those item types? """
 
-with open('Day 3 - input.txt') as f:
-    lines = f.readlines()
-
 #print(ord('z')-96)
 #print(ord('Z')-38)
 
-priority = []
-
-for rucksack in lines:
-    rucksack = rucksack[:-1]
-    half = len(rucksack)//2
-    compartment1 = set(rucksack[0:half])
-    compartment2 = set(rucksack[half:])
-    item = compartment1.intersection(compartment2).pop()
-    if item.isupper():
-        priority.append(ord(item)-38)
-    else:
-        priority.append(ord(item)-96)
-
-print(sum(priority)) # Ans: 8515
+import string
+
+# Item type -> a bit at its priority, so a rucksack is an integer mask of the item types in it
+BITS = {item: 1 << priority for priority, item in enumerate(string.ascii_lowercase + string.ascii_uppercase, 1)}
+
+def mask(items):
+    m = 0
+    for item in items:
+        m |= BITS[item]
+    return m
+
+# The one bit left after the ANDs is the shared item, its index is the priority
+def priority(m):
+    if not m or m & (m - 1):
+        raise ValueError('Expected exactly one shared item type, found {}'.format(bin(m).count('1')))
+    return m.bit_length() - 1
+
+# Three masks are built a character at a time for every rucksack, so NumPy makes up for its import
+# from around 1MB of input
+NUMPY_THRESHOLD = 1000000
+
+def parse(text):
+    if len(text) > NUMPY_THRESHOLD:
+        return parse_bytes(text.encode())
+    return parse_lines(text.splitlines())
+
+# Both parts in one pass: the compartments' masks give part 1, and the whole rucksack's mask is
+# kept for its group's badge in part 2.
+def parse_lines(lines):
+    total1 = 0
+    total2 = 0
+    group = -1
+    n = 0
+    # Blank lines aren't rucksacks, and don't count towards a group of three
+    for rucksack in filter(None, lines):
+        half = len(rucksack)//2
+        compartment1 = mask(rucksack[:half])
+        compartment2 = mask(rucksack[half:])
+        total1 += priority(compartment1 & compartment2)
+
+        group &= compartment1 | compartment2
+        if n % 3 == 2:
+            total2 += priority(group)
+            group = -1
+        n += 1
+
+    return total1, total2
+
+# The whole input at once with NumPy: every byte becomes its priority through a lookup table and
+# is marked in its line's row of a presence matrix, one for each compartment, so the shared items
+# and badges are ANDs of rows and argmax finds their column, which is their priority.
+def parse_bytes(data):
+    import numpy as np
+
+    priorities = np.zeros(256, dtype=np.uint8)
+    for item, bit in BITS.items():
+        priorities[ord(item)] = bit.bit_length() - 1
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    if len(buffer) == 0 or buffer[-1] != ord('\n'):
+        buffer = np.append(buffer, np.uint8(ord('\n')))
+    newlines = np.flatnonzero(buffer == ord('\n'))
+    starts = np.concatenate(([0], newlines[:-1] + 1))
+    # Windows line endings aren't part of the rucksack
+    ends = newlines - ((buffer[newlines - 1] == ord('\r')) & (newlines > starts))
+    lines = len(starts)
+
+    # Line endings have priority 0 and end up in the unused column 0, nothing else should
+    codes = priorities[buffer]
+    bad = buffer[(codes == 0) & (buffer != ord('\n')) & (buffer != ord('\r'))]
+    if len(bad):
+        raise ValueError('{!r} is not an item type'.format(chr(bad[0])))
+
+    # Every byte's place in the presence matrices: its line's row, plus a whole matrix further on
+    # for the second compartment
+    index = np.int32 if 2 * lines * 53 < 2**31 else np.int64
+    row = np.repeat(np.arange(lines, dtype=index) * 53, newlines - starts + 1)
+    halves = np.zeros(len(buffer) + 1, dtype=np.int8)
+    halves[starts] += 1
+    halves[starts + (ends - starts) // 2] -= 1
+    first = np.cumsum(halves[:-1], dtype=np.int8).view(bool)
+    place = np.where(first, row, row + lines * 53) + codes
+
+    present = np.zeros(2 * lines * 53, dtype=bool)
+    present[place] = True
+    compartment1, compartment2 = present.reshape(2, lines, 53)
+    compartment1[:, 0] = False
+    compartment2[:, 0] = False
+
+    # Blank lines aren't rucksacks, and a group that isn't three rucksacks long has no badge
+    filled = ends > starts
+    shared = (compartment1 & compartment2)[filled]
+    rucksacks = (compartment1 | compartment2)[filled]
+    badges = rucksacks[:len(rucksacks) - len(rucksacks) % 3].reshape(-1, 3, 53).all(axis=1)
+    return single_items(shared), single_items(badges)
+
+# The sum of the priorities of the one item type on each row, like priority() for every row at once
+def single_items(rows):
+    counts = rows.sum(axis=1)
+    if (counts != 1).any():
+        raise ValueError('Expected exactly one shared item type, found {}'.format(counts[counts != 1][0]))
+    return int(rows.argmax(axis=1).sum())
+
+def part1(totals):
+    return totals[0]
 
 """ --- Part Two ---
 As you finish identifying the misplaced items, the Elves come to you with another issue.
@@ -75,16 +163,15 @@ Priorities for these items must still be found to organize the sticker attachmen
 
 Find the item type that corresponds to the badges of each three-Elf group. What is the sum of the priorities of those item types? """
 
-priority = []
+def part2(totals):
+    return totals[1]
+
+def main():
+    with open('Day 3 - input.txt') as f:
+        totals = parse(f.read())
 
-for i in range(0, len(lines), 3):
-    elf1 = set(lines[i][:-1])
-    elf2 = set(lines[i + 1][:-1])
-    elf3 = set(lines[i + 2][:-1])
-    item = elf1.intersection(elf2, elf3).pop()
-    if item.isupper():
-        priority.append(ord(item)-38)
-    else:
-        priority.append(ord(item)-96)
+    print(part1(totals)) # Ans: 8515
+    print(part2(totals)) # Ans: 2434
 
-print(sum(priority)) # Ans: 8515
\ No newline at end of file
+if __name__ == '__main__':
+    main()
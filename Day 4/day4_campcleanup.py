@@ -39,28 +39,66 @@ Some of the pairs have noticed that one of their assignments fully contains the
 
 In how many assignment pairs does one range fully contain the other? """
 
-with open('Day 4 - input.txt') as f:
-    lines = f.readlines()
-
-fully_contain = 0
-overlap = 0
-
-for ids in lines:
-    ids = ids[:-1].split(',')
-    id1_min = int(ids[0].split('-')[0])
-    id1_max = int(ids[0].split('-')[1])
-    id2_min = int(ids[1].split('-')[0])
-    id2_max = int(ids[1].split('-')[1])
-    
-    if id1_min <= id2_min and id1_max >= id2_max:
-        fully_contain += 1
-    elif id2_min <= id1_min and id2_max >= id1_max:
-        fully_contain += 1\
-
-    if len(set(range(id1_min, id1_max + 1)) | set(range(id2_min, id2_max + 1))) < (id1_max + 1 - id1_min) + (id2_max + 1 - id2_min):
-        overlap += 1
-
-print(fully_contain) # Ans: 431
+import bisect
+from collections import namedtuple
+
+# Four int() calls and three splits a line make Day 4 the slowest of these in Python, NumPy makes
+# up for its import from under 1MB of input
+NUMPY_THRESHOLD = 1000000
+
+def parse(text):
+    if len(text) > NUMPY_THRESHOLD:
+        return parse_bytes(text.encode())
+    return parse_lines(text.splitlines())
+
+# A line is two ranges of section IDs, 'a-b,c-d'
+def read_pair(line):
+    first, second = line.split(',')
+    id1_min, id1_max = first.split('-')
+    id2_min, id2_max = second.split('-')
+    return int(id1_min), int(id1_max), int(id2_min), int(id2_max)
+
+# Both parts are counted in one pass, comparing only the ends of the ranges, so how far apart
+# they are doesn't matter.
+def parse_lines(lines):
+    fully_contain = 0
+    overlap = 0
+    for line in lines:
+        id1_min, id1_max, id2_min, id2_max = read_pair(line)
+        if (id1_min <= id2_min and id1_max >= id2_max) or (id2_min <= id1_min and id2_max >= id1_max):
+            fully_contain += 1
+        if id1_min <= id2_max and id2_min <= id1_max:
+            overlap += 1
+
+    return fully_contain, overlap
+
+# Every line as a row of an (n, 4) array: with the separators turned into spaces the whole input
+# is a list of numbers np.fromstring reads in one go. That only works if every line has its
+# separators in the right order, '-', ',', '-' then the line ending, so anything else (spaces, a
+# misplaced separator, a blank line) is read line by line with read_pair, which raises on what
+# parse_lines would.
+def read_pairs(data):
+    import numpy as np
+
+    buffer = np.frombuffer(data if data.endswith(b'\n') else data + b'\n', dtype=np.uint8)
+    separators = buffer[(buffer - ord('0') > 9) & (buffer != ord('\r'))]
+    lines = len(separators) // 4
+    if len(separators) % 4 == 0 and (separators.reshape(-1, 4) == np.frombuffer(b'-,-\n', dtype=np.uint8)).all():
+        numbers = np.fromstring(data.translate(bytes.maketrans(b',-', b'  ')), dtype=np.int64, sep=' ')
+        if len(numbers) == 4 * lines:
+            return numbers.reshape(-1, 4)
+    return np.array([read_pair(line) for line in data.decode().splitlines()], dtype=np.int64).reshape(-1, 4)
+
+def parse_bytes(data):
+    import numpy as np
+
+    id1_min, id1_max, id2_min, id2_max = read_pairs(data).T
+    fully_contain = ((id1_min <= id2_min) & (id1_max >= id2_max)) | ((id2_min <= id1_min) & (id2_max >= id1_max))
+    overlap = (id1_min <= id2_max) & (id2_min <= id1_max)
+    return int(np.count_nonzero(fully_contain)), int(np.count_nonzero(overlap))
+
+def part1(counts):
+    return counts[0]
 
 """ --- Part Two ---
 It seems like there is still quite a bit of duplicate work planned. Instead, the Elves would like to know the number of pairs that overlap at all.
@@ -75,4 +113,100 @@ So, in this example, the number of overlapping assignment pairs is 4.
 
 In how many assignment pairs do the ranges overlap? """
 
-print(overlap) # Ans = 823
\ No newline at end of file
+def part2(counts):
+    return counts[1]
+
+# Every elf's range of sections in input order, two to a line. Elves are numbered from 1 in that
+# order. read_pairs(data).reshape(-1, 2).tolist() gives the same ranges from the NumPy path.
+def assignments(lines):
+    for line in lines:
+        id1_min, id1_max, id2_min, id2_max = read_pair(line)
+        yield id1_min, id1_max
+        yield id2_min, id2_max
+
+# An index of every elf's range for questions about the whole camp rather than a single pair:
+#
+#     index = build_index(assignments(text.splitlines()))
+#     overlapping(index, 10, 20)        elves whose range shares a section with 10-20
+#     count_overlapping(index, 10, 20)  how many of them there are
+#     index.most_covered                (section covered by the most elves, how many)
+#
+# The ranges are sorted by their first section and laid out as the leaves of a binary tree whose
+# nodes hold the highest last section below them, so a query only walks down the branches that
+# can still hold an overlapping range: O(log n + k) for k elves found.
+Index = namedtuple('Index', 'lows elves highs tree most_covered')
+
+def build_index(ranges):
+    firsts = []
+    lasts = []
+    for id_min, id_max in ranges:
+        firsts.append(id_min)
+        lasts.append(id_max)
+    order = sorted(range(len(firsts)), key=firsts.__getitem__)
+    lows = [firsts[n] for n in order]
+    elves = [n + 1 for n in order]
+    highs = sorted(lasts)
+
+    size = 1
+    while size < len(order):
+        size *= 2
+    tree = [float('-inf')] * (2 * size)
+    tree[size:size + len(order)] = [lasts[n] for n in order]
+    # One level of the tree at a time, each node is the higher of its two children
+    level = size
+    while level > 1:
+        tree[level // 2:level] = map(max, tree[level:2 * level:2], tree[level + 1:2 * level:2])
+        level //= 2
+
+    return Index(lows, elves, highs, tree, most_covered(lows, highs))
+
+# The number of elves on a section is how many ranges start at or before it less how many end
+# before it, and it can only go up where a range starts, so those are the only sections to try.
+def most_covered(lows, highs):
+    busiest = (None, 0)
+    for section in dict.fromkeys(lows):
+        elves = bisect.bisect_right(lows, section) - bisect.bisect_left(highs, section)
+        if elves > busiest[1]:
+            busiest = (section, elves)
+    return busiest
+
+# Both queries take a range of sections the way the input writes one, lowest first
+def check_query(id_min, id_max):
+    if id_min > id_max:
+        raise ValueError('A range of sections goes from low to high, got {}-{}'.format(id_min, id_max))
+
+def overlapping(index, id_min, id_max):
+    check_query(id_min, id_max)
+    lows, elves, highs, tree = index.lows, index.elves, index.highs, index.tree
+    # Only ranges starting at or before id_max can overlap, they are the first `end` leaves
+    end = bisect.bisect_right(lows, id_max)
+    size = len(tree) // 2
+    found = []
+    stack = [(1, 0, size)]
+    while stack:
+        node, left, right = stack.pop()
+        if left >= end or tree[node] < id_min:
+            continue
+        if node >= size:
+            found.append(elves[node - size])
+            continue
+        middle = (left + right) // 2
+        stack.append((2 * node + 1, middle, right))
+        stack.append((2 * node, left, middle))
+    return sorted(found)
+
+# Every range starting at or before id_max overlaps unless it ends before id_min, and a range
+# ending before id_min starts before id_max too (as long as id_min <= id_max), so this is O(log n).
+def count_overlapping(index, id_min, id_max):
+    check_query(id_min, id_max)
+    return bisect.bisect_right(index.lows, id_max) - bisect.bisect_left(index.highs, id_min)
+
+def main():
+    with open('Day 4 - input.txt') as f:
+        counts = parse(f.read())
+
+    print(part1(counts)) # Ans: 431
+    print(part2(counts)) # Ans = 823
+
+if __name__ == '__main__':
+    main()
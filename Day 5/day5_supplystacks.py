@@ -49,40 +49,173 @@ The Elves just need to know which crate will end up on top of each stack; in thi
 
 After the rearrangement procedure completes, what crate ends up on top of each stack? """
 
-with open('Day 5 - input.txt') as f:
-    lines = f.readlines()
-
-crates = lines[0:9]
-moves = lines[10:]
-
-stacks = []
-for i in range(1, len(crates[0]), 4):
-    stack = []
-    for j in range(len(crates)-1):
-        if crates[j][i] != ' ':
-            stack.append(crates[j][i])
-    stack.reverse()
-    stacks.append(stack)
-
-times = []
-fr = []
-to = []
-for move in moves:
-    split = move.split(' ')
-    times.append(int(split[1]))
-    fr.append(int(split[3]))
-    to.append(int(split[5][0]))
-
-for k in range(len(times)):
-    for _ in range(times[k]):
-        crate = stacks[fr[k]-1].pop()
-        stacks[to[k]-1].append(crate)
-
-top = []
-for stack in stacks:
-    top.append(stack[-1])
-
-print(''.join(top)) # Ans: TLFGBZHCN
+import bisect
+import math
+import re
+from array import array
+
+BAD_MOVE = 'Every move should look like "move 1 from 2 to 3", got {!r}'
+
+# The first blank line, whatever the line endings and even with spaces on it, like parse_lines
+BLANK_LINE = re.compile(r'(?:^|\r?\n)[ \t]*\r?\n')
+
+def parse(text):
+    blank = BLANK_LINE.search(text)
+    diagram, moves = (text[:blank.start()], text[blank.end():]) if blank else (text, '')
+    # Every move is 'move N from A to B', six words with the numbers in between the others
+    words = moves.split()
+    if len(words) % 6 != 0 or set(words[0::6]) - {'move'} or set(words[2::6]) - {'from'} or set(words[4::6]) - {'to'}:
+        bad = next((line for line in moves.splitlines() if line.split() and line.split()[0::2] != ['move', 'from', 'to']), moves)
+        raise ValueError(BAD_MOVE.format(bad))
+    return check_moves(read_diagram(diagram.splitlines()), array('q', map(int, words[1::2])))
+
+# The drawing runs up to the first blank line and the moves follow. The moves are kept as one flat
+# array of integers, three to a move: how many crates, from which stack, to which stack.
+def parse_lines(lines):
+    lines = iter(lines)
+    diagram = []
+    for line in lines:
+        if line.strip() == '':
+            break
+        diagram.append(line)
+
+    moves = array('q')
+    for line in lines:
+        split = line.split()
+        if not split:
+            continue
+        if len(split) != 6 or split[0::2] != ['move', 'from', 'to']:
+            raise ValueError(BAD_MOVE.format(line))
+        moves.extend((int(split[1]), int(split[3]), int(split[5])))
+
+    return check_moves(read_diagram(diagram), moves)
+
+# Every move has to be between stacks that are in the drawing. min and max go through the array
+# quickly, the moves are only gone through one by one to report the first bad one.
+def check_moves(stacks, moves):
+    if moves and (min(moves[0::3]) < 0 or min(min(moves[1::3]), min(moves[2::3])) < 1
+                  or max(max(moves[1::3]), max(moves[2::3])) > len(stacks)):
+        for n in range(0, len(moves), 3):
+            times, fr, to = moves[n:n+3]
+            if times < 0 or not 1 <= fr <= len(stacks) or not 1 <= to <= len(stacks):
+                raise ValueError('Move {} (move {} from {} to {}) needs stacks 1 to {} and a count of at least 0'.format(
+                    n // 3 + 1, times, fr, to, len(stacks)))
+    return stacks, moves
+
+# The last line of the drawing numbers the stacks, however many there are. A crate belongs to the
+# stack whose number is drawn below it, or the closest one when numbers with more digits spread
+# them out.
+def read_diagram(diagram):
+    labels = [(match.start() + match.end() - 1) / 2 for match in re.finditer(r'\d+', diagram[-1])]
+    numbers = [int(number) for number in diagram[-1].split()]
+    if numbers != list(range(1, len(numbers) + 1)):
+        raise ValueError('Expected the stacks to be numbered 1 to {}, got {}'.format(len(numbers), diagram[-1].strip()))
+
+    stacks = [[] for _ in labels]
+    for line in reversed(diagram[:-1]):
+        for match in re.finditer(r'\[(.)\]', line):
+            column = match.start(1)
+            n = bisect.bisect_left(labels, column)
+            if n == len(labels) or (n > 0 and column - labels[n - 1] <= labels[n] - column):
+                n -= 1
+            stacks[n].append(match.group(1))
+
+    return stacks
+
+def too_many(times, fr, height):
+    return ValueError('Can not move {} crates from stack {}, it only has {}'.format(times, fr, height))
+
+# Every crate moved is copied, but in one slice per move
+def rearrange_lists(parsed, reverse):
+    stacks, moves = parsed
+    stacks = [stack.copy() for stack in stacks]
+    apply_moves(stacks, moves, reverse)
+
+    top = []
+    for stack in stacks:
+        top.append(stack[-1] if stack else '')
+
+    return ''.join(top)
+
+# reverse=True moves the crates one at a time (the CrateMover 9000), so they land in reverse order.
+# Either way a move from a stack onto itself puts every crate back where it was.
+def apply_moves(stacks, moves, reverse):
+    steps = iter(moves)
+    for times, fr, to in zip(steps, steps, steps):
+        source = stacks[fr-1]
+        if times > len(source):
+            raise too_many(times, fr, len(source))
+        if fr == to:
+            continue
+        crates = source[len(source) - times:]
+        del source[len(source) - times:]
+        if reverse:
+            crates.reverse()
+        stacks[to-1] += crates
+
+# Only the crates that end up on top matter, so instead of moving every crate this follows those
+# crates backwards through the moves, from the top of each stack to where they started. All it
+# needs is the stacks' heights and where each of the followed crates is, as a stack and a depth
+# from the top. Moves that don't touch a stack holding one of them are skipped straight away.
+def trace_tops(parsed, reverse):
+    stacks, moves = parsed
+    heights = [len(stack) for stack in stacks]
+    steps = iter(moves)
+    for times, fr, to in zip(steps, steps, steps):
+        if times > heights[fr-1]:
+            raise too_many(times, fr, heights[fr-1])
+        heights[fr-1] -= times
+        heights[to-1] += times
+
+    # followed[stack] holds [stack the crate ends up on top of, its depth]
+    followed = [[[n, 0]] if height else [] for n, height in enumerate(heights)]
+    steps = reversed(moves)
+    for to, fr, times in zip(steps, steps, steps):
+        # A move onto the same stack puts every crate back where it was
+        if fr == to:
+            continue
+        source = followed[fr-1]
+        destination = followed[to-1]
+        if not source and not destination:
+            continue
+
+        # Crates in the top `times` of the destination came from the top of the source
+        for crate in source:
+            crate[1] += times
+        stayed = []
+        for crate in destination:
+            if crate[1] < times:
+                if reverse:
+                    crate[1] = times - 1 - crate[1]
+                source.append(crate)
+            else:
+                crate[1] -= times
+                stayed.append(crate)
+        followed[to-1] = stayed
+
+    top = [''] * len(stacks)
+    for stack, crates in zip(stacks, followed):
+        for n, depth in crates:
+            top[n] = stack[-1 - depth]
+
+    return ''.join(top)
+
+# 'lists' moves every crate, 'trace' follows the top ones back
+SOLVERS = {'trace': trace_tops, 'lists': rearrange_lists}
+
+# Below this many crates per move on average, moving slices of plain lists is the fastest
+BULK_MOVE = 64
+
+# Following the top crates back costs the same for every move, however many crates it moves, so
+# by default it takes moves of BULK_MOVE crates or more on average, and plain lists the rest.
+def solve(parsed, reverse, method=None):
+    if method is None:
+        stacks, moves = parsed
+        method = 'trace' if sum(moves[0::3]) >= BULK_MOVE * (len(moves) // 3) else 'lists'
+    return SOLVERS[method](parsed, reverse)
+
+def part1(parsed, method=None):
+    return solve(parsed, True, method)
 
 """ --- Part Two ---
 As you watch the crane operator expertly rearrange the crates, you notice the process isn't following your prediction.
@@ -128,31 +261,53 @@ In this example, the CrateMover 9001 has put the crates in a totally different o
 
 Before the rearrangement process finishes, update your simulation so that the Elves know where they should stand to be ready to unload the final supplies. After the rearrangement procedure completes, what crate ends up on top of each stack? """
 
-stacks = []
-for i in range(1, len(crates[0]), 4):
-    stack = []
-    for j in range(len(crates)-1):
-        if crates[j][i] != ' ':
-            stack.append(crates[j][i])
-    stack.reverse()
-    stacks.append(stack)
-
-times = []
-fr = []
-to = []
-for move in moves:
-    split = move.split(' ')
-    times.append(int(split[1]))
-    fr.append(int(split[3]))
-    to.append(int(split[5][0]))
-
-for k in range(len(times)):
-    crate = stacks[fr[k]-1][-times[k]:]
-    stacks[fr[k]-1] = stacks[fr[k]-1][:-times[k]]
-    stacks[to[k]-1] += crate
-
-top = []
-for stack in stacks:
-    top.append(stack[-1])
-
-print(''.join(top)) # Ans: QRQFHFWCL
\ No newline at end of file
+def part2(parsed, method=None):
+    return solve(parsed, False, method)
+
+# The stacks part way through the moves, for any number of moves, without starting over each time:
+#
+#     checkpoints = replay(parsed, reverse=True)
+#     state_after(checkpoints, 1000)   stacks after the first 1000 moves, bottom to top
+#
+# replay() runs through the moves once and keeps a snapshot of the stacks every `every` moves
+# (about the square root of the number of moves by default), each stack as a tuple. Only stacks
+# that changed since the last snapshot are copied, the others are shared with it. state_after()
+# starts from the last snapshot at or before the move asked for and replays the rest.
+def replay(parsed, reverse, every=None):
+    stacks, moves = parsed
+    count = len(moves) // 3
+    if every is None:
+        every = max(1, math.isqrt(count))
+
+    stacks = [stack.copy() for stack in stacks]
+    snapshots = [[tuple(stack) for stack in stacks]]
+    for start in range(0, count - every + 1, every):
+        chunk = moves[3 * start:3 * (start + every)]
+        apply_moves(stacks, chunk, reverse)
+        changed = set(chunk[1::3]) | set(chunk[2::3])
+        snapshot = snapshots[-1].copy()
+        for number in changed:
+            snapshot[number-1] = tuple(stacks[number-1])
+        snapshots.append(snapshot)
+
+    return moves, reverse, every, snapshots
+
+def state_after(checkpoints, k):
+    moves, reverse, every, snapshots = checkpoints
+    if not 0 <= k <= len(moves) // 3:
+        raise ValueError('There are only {} moves, asked for the stacks after {}'.format(len(moves) // 3, k))
+
+    start = min(k // every, len(snapshots) - 1) * every
+    stacks = [list(stack) for stack in snapshots[start // every]]
+    apply_moves(stacks, moves[3 * start:3 * k], reverse)
+    return stacks
+
+def main():
+    with open('Day 5 - input.txt') as f:
+        parsed = parse(f.read())
+
+    print(part1(parsed)) # Ans: TLFGBZHCN
+    print(part2(parsed)) # Ans: QRQFHFWCL
+
+if __name__ == '__main__':
+    main()
@@ -28,21 +28,41 @@ nznrnfrfntjfmvfwmzdfjlvtqnbhcprsg: first marker after character 10
 zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw: first marker after character 11
 How many characters need to be processed before the first start-of-packet marker is detected? """
 
-with open('Day 6 - input.txt') as f:
-    line = f.readlines()[0]
-
-recent = list(line[0:4])
-line = line[4:]
-index = 4
-if len(set(recent)) != 4:
-    for char in line:
-        recent.append(char)
-        recent.pop(0)
-        index += 1
-        if len(set(recent)) == 4:
+# Start-of-packet and start-of-message markers
+SIZES = (4, 14)
+
+def parse(text):
+    return parse_lines(text.splitlines())
+
+# Both markers are found in one pass over the datastream
+def parse_lines(lines):
+    for line in lines:
+        return find_markers(line, SIZES)
+    raise ValueError('empty datastream')
+
+# Index just past the first run of n distinct characters, for each n in sizes (None if there isn't
+# one). The run of distinct characters ending at each character starts just after the last time
+# that character was seen, if that was inside the run, so every character costs O(1) whatever the
+# sizes are, and the run is the same for every size.
+def find_markers(line, sizes):
+    markers = dict.fromkeys(sizes)
+    waiting = sorted(sizes)
+    last_seen = {}
+    start = 0
+    for index, char in enumerate(line):
+        seen = last_seen.get(char, -1)
+        if seen >= start:
+            start = seen + 1
+        last_seen[char] = index
+        while waiting and index + 1 - start >= waiting[0]:
+            markers[waiting.pop(0)] = index + 1
+        if not waiting:
             break
 
-print(index) # Ans: 1093
+    return tuple(markers[n] for n in sizes)
+
+def part1(markers):
+    return markers[0]
 
 """ --- Part Two ---
 Your device's communication system is correctly detecting packets, but still isn't working. It looks like it also needs to look for messages.
@@ -51,18 +71,15 @@ A start-of-message marker is just like a start-of-packet marker, except it consi
 
 Here are the first positions of start-of-message markers for all of the above examples: """
 
-with open('Day 6 - input.txt') as f:
-    line = f.readlines()[0]
-
-recent = list(line[0:14])
-line = line[14:]
-index = 14
-if len(set(recent)) != 14:
-    for char in line:
-        recent.append(char)
-        recent.pop(0)
-        index += 1
-        if len(set(recent)) == 14:
-            break
+def part2(markers):
+    return markers[1]
+
+def main():
+    with open('Day 6 - input.txt') as f:
+        markers = parse(f.read())
+
+    print(part1(markers)) # Ans: 1093
+    print(part2(markers)) # Ans: 3534
 
-print(index) # Ans: 1093
\ No newline at end of file
+if __name__ == '__main__':
+    main()
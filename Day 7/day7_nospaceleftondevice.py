@@ -73,54 +73,59 @@ To begin, find all of the directories with a total size of at most 100000, then
 
 Find all of the directories with a total size of at most 100000. What is the sum of the total sizes of those directories? """
 
-with open('Day 7 - input.txt') as f:
-    lines = f.readlines()
-
-folder = {}
-folder_size = {}
-path = []
-start_ls = False
-
 def getPath(path):
   return path[0] + '/'.join(path[1:])
 
-for line in lines:
-  split = line.split(' ')
-  if split[1] == 'cd':
-    if start_ls:
-      start_ls = False
-      folder[getPath(path)] = (dir_list, total_size)
-    if split[2] == '..\n':
-      path.pop()
-    else:
-      path.append(split[2][:-1])
-  elif split[0] == '$' and split[1] == 'ls\n':
-    start_ls = True
-    dir_list = []
-    total_size = 0
-  elif start_ls:
-    if split[0] == 'dir':
-      dir_list.append(getPath(path + [split[1][:-1]]))
-    else:
-      total_size += int(split[0])
-folder[getPath(path)] = (dir_list, total_size) # Add the last directory to the folder dictionary.
+def parse(text):
+  return parse_lines(text.splitlines())
+
+def parse_lines(lines):
+  folder = {}
+  path = []
+  start_ls = False
+
+  for line in lines:
+    split = line.split(' ')
+    if split[1] == 'cd':
+      if start_ls:
+        start_ls = False
+        folder[getPath(path)] = (dir_list, total_size)
+      if split[2] == '..':
+        path.pop()
+      else:
+        path.append(split[2])
+    elif split[0] == '$' and split[1] == 'ls':
+      start_ls = True
+      dir_list = []
+      total_size = 0
+    elif start_ls:
+      if split[0] == 'dir':
+        dir_list.append(getPath(path + [split[1]]))
+      else:
+        total_size += int(split[0])
+  folder[getPath(path)] = (dir_list, total_size) # Add the last directory to the folder dictionary.
+
+  # Find the size of each folder up front, both parts only need the totals.
+  folder_size = {}
+  for key in folder.keys():
+    folder_size[key] = findFolderSize(folder, key)
+
+  return folder_size
 
 # Recursive function to find the size of each folder.
-def findFolderSize(name):
+def findFolderSize(folder, name):
   if folder[name][0] == []:
     return folder[name][1]
   else:
-    return sum([findFolderSize(fol) for fol in folder[name][0]]) + folder[name][1]
-
-for key in folder.keys():
-  folder_size[key] = findFolderSize(key)
+    return sum([findFolderSize(folder, fol) for fol in folder[name][0]]) + folder[name][1]
 
-total_size_under_100k = 0
-for key, size in folder_size.items():
-  if size <= 100000:
-    total_size_under_100k += size
+def part1(folder_size):
+  total_size_under_100k = 0
+  for key, size in folder_size.items():
+    if size <= 100000:
+      total_size_under_100k += size
 
-print(total_size_under_100k) # Ans: 1915606
+  return total_size_under_100k
 
 """ Now, you're ready to choose a directory to delete.
 
@@ -138,14 +143,25 @@ Directories e and a are both too small; deleting them would not free up enough s
 
 Find the smallest directory that, if deleted, would free up enough space on the filesystem to run the update. What is the total size of that directory? """
 
-total_space = 70000000
-used_space = folder_size['/']
-req_space = 30000000
-delete_space = req_space - (total_space - used_space)
+def part2(folder_size):
+  total_space = 70000000
+  used_space = folder_size['/']
+  req_space = 30000000
+  delete_space = req_space - (total_space - used_space)
+
+  smallest_size = float('inf')
+  for key, val in folder_size.items():
+    if val > delete_space:
+      smallest_size = min(smallest_size, val);
+
+  return smallest_size
+
+def main():
+  with open('Day 7 - input.txt') as f:
+    folder_size = parse(f.read())
 
-smallest_size = float('inf')
-for key, val in folder_size.items():
-  if val > delete_space:
-    smallest_size = min(smallest_size, val);
+  print(part1(folder_size)) # Ans: 1915606
+  print(part2(folder_size)) # Ans 5025657
 
-print(smallest_size) # Ans 5025657
\ No newline at end of file
+if __name__ == '__main__':
+  main()
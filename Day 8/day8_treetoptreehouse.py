@@ -27,15 +27,23 @@ With 16 trees visible on the edge and another 5 visible in the interior, a total
 
 Consider your map; how many trees are visible from outside the grid? """
 
-with open('Day 8 - input.txt') as f:
-    lines = f.readlines()
+def parse(text):
+    return parse_rows(text.splitlines())
 
-forest = []
-for line in lines:
-    tree_row = [int(n) for n in line if n != '\n']
-    forest.append(tree_row)
+# grid is a 2D array of the input's character codes, e.g. from aoc2022.grid.load_grid. The trees
+# are compared one at a time below, which is much quicker on lists than on a NumPy array.
+def parse_grid(grid):
+    return (grid - ord('0')).tolist()
 
-def visibleFromLeft(row, col):
+def parse_rows(rows):
+    forest = []
+    for line in rows:
+        tree_row = [int(n) for n in line]
+        forest.append(tree_row)
+
+    return forest
+
+def visibleFromLeft(forest, row, col):
     tree = forest[row][col]
     if col == 0:
         return True
@@ -47,7 +55,7 @@ def visibleFromLeft(row, col):
     
     return True
 
-def visibleFromRight(row, col):
+def visibleFromRight(forest, row, col):
     tree = forest[row][col]
     if col == len(forest[0]) - 1:
         return True
@@ -59,7 +67,7 @@ def visibleFromRight(row, col):
     
     return True
 
-def visibleFromTop(row, col):
+def visibleFromTop(forest, row, col):
     tree = forest[row][col]
     if row == 0:
         return True
@@ -71,7 +79,7 @@ def visibleFromTop(row, col):
     
     return True
 
-def visibleFromBottom(row, col):
+def visibleFromBottom(forest, row, col):
     tree = forest[row][col]
     if row == len(forest) - 1:
         return True
@@ -83,13 +91,14 @@ def visibleFromBottom(row, col):
     
     return True
 
-visible = 0
-for row in range(len(forest)):
-    for col in range(len(forest[0])):
-        if visibleFromLeft(row, col) or visibleFromRight(row, col) or visibleFromTop(row, col) or visibleFromBottom(row, col):
-            visible += 1
+def part1(forest):
+    visible = 0
+    for row in range(len(forest)):
+        for col in range(len(forest[0])):
+            if visibleFromLeft(forest, row, col) or visibleFromRight(forest, row, col) or visibleFromTop(forest, row, col) or visibleFromBottom(forest, row, col):
+                visible += 1
 
-print(visible) # Ans: 1854
+    return visible
 
 """ --- Part Two ---
 Content with the amount of tree cover available, the Elves just need to know the best spot to build their tree house: they would like to be able to see a lot of trees.
@@ -126,7 +135,7 @@ This tree's scenic score is 8 (2 * 2 * 1 * 2); this is the ideal spot for the tr
 
 Consider each tree on your map. What is the highest scenic score possible for any tree? """
 
-def visibleLookingLeft(row, col):
+def visibleLookingLeft(forest, row, col):
     tree = forest[row][col]
     num = 0
     if col == 0:
@@ -134,14 +143,14 @@ def visibleLookingLeft(row, col):
     
     while col > 0:
         col -= 1
-        if forest[row][col] == tree:
+        if forest[row][col] >= tree:
             return num + 1
         elif forest[row][col] < tree:
             num += 1
     
     return num
 
-def visibleLookingRight(row, col):
+def visibleLookingRight(forest, row, col):
     tree = forest[row][col]
     num = 0
     if col == len(forest[0]) - 1:
@@ -149,14 +158,14 @@ def visibleLookingRight(row, col):
     
     while col < len(forest[0]) - 1:
         col += 1
-        if forest[row][col] == tree:
+        if forest[row][col] >= tree:
             return num + 1
         elif forest[row][col] < tree:
             num += 1
     
     return num
 
-def visibleLookingTop(row, col):
+def visibleLookingTop(forest, row, col):
     tree = forest[row][col]
     num = 0
     if row == 0:
@@ -164,14 +173,14 @@ def visibleLookingTop(row, col):
     
     while row > 0:
         row -= 1
-        if forest[row][col] == tree:
+        if forest[row][col] >= tree:
             return num + 1
         elif forest[row][col] < tree:
             num += 1
     
     return num
 
-def visibleLookingBottom(row, col):
+def visibleLookingBottom(forest, row, col):
     tree = forest[row][col]
     num = 0
     if row == len(forest) - 1:
@@ -179,16 +188,27 @@ def visibleLookingBottom(row, col):
     
     while row < len(forest) - 1:
         row += 1
-        if forest[row][col] == tree:
+        if forest[row][col] >= tree:
             return num + 1
         elif forest[row][col] < tree:
             num += 1
     
     return num
 
-score = 0
-for row in range(len(forest)):
-    for col in range(len(forest[0])):
-        score = max(score, visibleLookingRight(row, col) * visibleLookingLeft(row, col) * visibleLookingTop(row, col) * visibleLookingBottom(row, col))
+def part2(forest):
+    score = 0
+    for row in range(len(forest)):
+        for col in range(len(forest[0])):
+            score = max(score, visibleLookingRight(forest, row, col) * visibleLookingLeft(forest, row, col) * visibleLookingTop(forest, row, col) * visibleLookingBottom(forest, row, col))
+
+    return score
+
+def main():
+    with open('Day 8 - input.txt') as f:
+        forest = parse(f.read())
+
+    print(part1(forest)) # Ans: 1854
+    print(part2(forest)) # Ans: 527340
 
-print(score) # Ans: 527340
+if __name__ == '__main__':
+    main()
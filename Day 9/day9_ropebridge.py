@@ -240,19 +240,19 @@ So, there are 13 positions the tail visited at least once.
 Simulate your complete hypothetical series of motions. How many positions does the tail of the rope visit at least once? """
 from math import copysign
 
-with open('Day 9 - input.txt') as f:
-    lines = f.readlines()
+def parse(text):
+    return parse_lines(text.splitlines())
 
-direction = []
-counter = []
+def parse_lines(lines):
+    direction = []
+    counter = []
 
-for line in lines:
-    split = line.split(' ')
-    direction.append(split[0])
-    counter.append(int(split[1][:-1]))
+    for line in lines:
+        split = line.split(' ')
+        direction.append(split[0])
+        counter.append(int(split[1]))
 
-head_pos = (0, 0)
-tail_pos = (0, 0)
+    return direction, counter
 
 def processDirection(head, direction):
     match direction:
@@ -279,14 +279,19 @@ def calculateTailPos(head, tail):
     else:
         return (tail[0] + int(copysign(1, head[0] - tail[0])), tail[1] + int(copysign(1, head[1] - tail[1])))
 
-visited = set([tail_pos])
-for i in range(len(direction)):
-    for n in range(counter[i]):
-        head_pos = processDirection(head_pos, direction[i])
-        tail_pos = calculateTailPos(head_pos, tail_pos)
-        visited.add(tail_pos)
+def part1(parsed):
+    direction, counter = parsed
+    head_pos = (0, 0)
+    tail_pos = (0, 0)
 
-print(len(visited)) # Ans: 5695
+    visited = set([tail_pos])
+    for i in range(len(direction)):
+        for n in range(counter[i]):
+            head_pos = processDirection(head_pos, direction[i])
+            tail_pos = calculateTailPos(head_pos, tail_pos)
+            visited.add(tail_pos)
+
+    return len(visited)
 
 """ --- Part Two ---
 A rope snaps! Suddenly, the river is getting a lot closer than you remember. The bridge is still there, but some of the ropes that broke are now whipping toward you as you fall through the air!
@@ -719,14 +724,26 @@ Now, the tail (9) visits 36 positions (including s) at least once:
 .........########.........
 Simulate your complete series of motions on a larger rope with ten knots. How many positions does the tail of the rope visit at least once? """
 
-knots_pos = [(0, 0)] * 10
-visited = set([knots_pos[-1]])
-for i in range(len(direction)):
-    for n in range(counter[i]):
-        knots_pos[0] = processDirection(knots_pos[0], direction[i])
-        for k in range(1, len(knots_pos)):
-            knots_pos[k] = calculateTailPos(knots_pos[k - 1], knots_pos[k])
-        visited.add(knots_pos[-1])
+def part2(parsed):
+    direction, counter = parsed
+    knots_pos = [(0, 0)] * 10
+
+    visited = set([knots_pos[-1]])
+    for i in range(len(direction)):
+        for n in range(counter[i]):
+            knots_pos[0] = processDirection(knots_pos[0], direction[i])
+            for k in range(1, len(knots_pos)):
+                knots_pos[k] = calculateTailPos(knots_pos[k - 1], knots_pos[k])
+            visited.add(knots_pos[-1])
+
+    return len(visited)
+
+def main():
+    with open('Day 9 - input.txt') as f:
+        parsed = parse(f.read())
 
-print(len(visited)) # Ans: 2434
+    print(part1(parsed)) # Ans: 5695
+    print(part2(parsed)) # Ans: 2434
 
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+""" Shared entry point for the Advent of Code 2022 solutions.
+
+Every day lives in its own 'Day N' folder next to its puzzle input and exposes the same three
+functions:
+
+    parse(text)     -> the parsed puzzle input
+    part1(parsed)   -> the answer to part 1
+    part2(parsed)   -> the answer to part 2
+
+The folders are not importable packages (their names have spaces), so the registry below loads
+each day's script straight from its file the first time it is asked for and keeps the module
+around. A long running process only pays the import cost once per day.
+
+Days 1 to 4 can also read a whole input at once with NumPy, in parse_bytes(data). Importing NumPy
+takes about a tenth of a second, which a puzzle sized input never wins back, so parse() only
+switches to it past the day's NUMPY_THRESHOLD characters. Each threshold is roughly where that
+day's NumPy path, import included, caught up with its Python loop on inputs from
+aoc2022.generate. The scripts run on their own too, so each keeps its threshold itself. """
+
+import importlib.util
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Day number -> script name inside 'Day N/'
+DAYS = {
+    1: 'day1caloriecounting',
+    2: 'day2rockpaperscissors',
+    3: 'day3rucksackreorganization',
+    4: 'day4_campcleanup',
+    5: 'day5_supplystacks',
+    6: 'day6_tuningtrouble',
+    7: 'day7_nospaceleftondevice',
+    8: 'day8_treetoptreehouse',
+    9: 'day9_ropebridge',
+    10: 'day10_cathoderaytube',
+    11: 'day11_monkeyinthemiddle',
+    12: 'day12_hillclimbing',
+    13: 'day13_distresssignal',
+    14: 'day14_regelithresevoir',
+    15: 'day15_beaconexclusionzone',
+}
+
+_modules = {}
+_versions = {}
+
+def day_dir(day):
+    return os.path.join(ROOT, 'Day ' + str(day))
+
+def script_path(day):
+    return os.path.join(day_dir(day), DAYS[day] + '.py')
+
+def input_path(day):
+    return os.path.join(day_dir(day), 'Day ' + str(day) + ' - input.txt')
+
+def load(day):
+    if day not in DAYS:
+        raise KeyError('No solution for day ' + str(day))
+
+    if day not in _modules:
+        spec = importlib.util.spec_from_file_location(DAYS[day], script_path(day))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        from aoc2022 import profiling
+        if profiling.enabled():
+            profiling.instrument(day, module)
+        _modules[day] = module
+
+    return _modules[day]
+
+# Hash of the day's script, so anything derived from an older version of a solution can be told apart.
+def version(day):
+    if day not in _versions:
+        import hashlib
+        with open(script_path(day), 'rb') as f:
+            _versions[day] = hashlib.sha256(f.read()).hexdigest()
+    return _versions[day]
+
+def read_input(day, path=None):
+    with open(path or input_path(day)) as f:
+        return f.read()
+
+def solve(day, text, parts=(1, 2)):
+    module = load(day)
+    parsed = module.parse(text)
+    solvers = {1: module.part1, 2: module.part2}
+    return [solvers[part](parsed) for part in parts]
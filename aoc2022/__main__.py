@@ -0,0 +1,152 @@
+""" Command line entry point, e.g.
+
+    python -m aoc2022 run --day 11 --part 2
+    python -m aoc2022 run --day 12 --cache
+    python -m aoc2022 run --day 1 --stream --input huge.txt
+    python -m aoc2022 run --day 1 --workers 8 --input huge.txt
+    python -m aoc2022 run --day 9 --profile
+    python -m aoc2022 run --day 13 --profile-output day13.pstats
+    python -m aoc2022 run --day 8 --input 'big forest.txt'
+    python -m aoc2022 run
+    python -m aoc2022 bench --days 8 9 --scale 100
+    python -m aoc2022 batch
+    python -m aoc2022 batch --day 11 inputs/day11/*.txt
+    python -m aoc2022 check
+"""
+
+import argparse
+import os
+import sys
+
+from aoc2022 import DAYS, input_path, load
+
+def run(args):
+    from aoc2022.runner import report, run_day
+
+    if args.input and args.day is None:
+        sys.exit('--input needs --day')
+    if args.stream and args.cache:
+        sys.exit('--stream and --cache can not be used together, the cache is keyed on the whole input')
+    if args.workers is not None and (args.stream or args.cache):
+        sys.exit('--workers can not be used with --stream or --cache')
+
+    cache = None
+    if args.cache:
+        from aoc2022.cache import ResultCache
+        cache = ResultCache(args.cache_dir)
+
+    from aoc2022 import profiling
+    if args.profile:
+        # Has to be set before any day is loaded, see aoc2022.profiling
+        os.environ[profiling.ENV] = '1'
+    if not profiling.enabled():
+        profiling = None
+
+    # Only after profiling is set up, loading a day is what instruments it
+    if args.workers is not None and (args.day is None or not hasattr(load(args.day), 'merge')):
+        sys.exit('--workers needs a --day whose input can be split into chunks (Day 1)')
+
+    profiler = None
+    if args.profile_output:
+        import cProfile
+        profiler = cProfile.Profile()
+
+    days = [args.day] if args.day is not None else list(DAYS)
+    parts = [args.part] if args.part is not None else [1, 2]
+    for day in days:
+        if profiler is not None:
+            profiler.enable()
+        answers, timings = run_day(day, args.input, parts, cache, args.stream, args.workers)
+        if profiler is not None:
+            profiler.disable()
+        print(report(day, answers, timings))
+        if profiling is not None:
+            print(profiling.report(day))
+
+    if profiler is not None:
+        profiler.dump_stats(args.profile_output)
+        print('Profile written to ' + args.profile_output)
+
+def bench(args):
+    from aoc2022 import benchmark
+
+    benchmark.main(args.days, args.scale, args.seed, args.timeout, args.output)
+
+def batch(args):
+    from aoc2022 import batch
+
+    if args.inputs and args.day is None:
+        sys.exit('input files need --day')
+
+    if args.inputs:
+        jobs = [(args.day, path) for path in args.inputs]
+    elif args.day is not None:
+        jobs = [(args.day, input_path(args.day))]
+    else:
+        jobs = None
+    cache_dir = None
+    if args.cache:
+        from aoc2022.cache import DEFAULT_DIR
+        cache_dir = args.cache_dir or DEFAULT_DIR
+    if batch.main(jobs, args.workers, cache_dir):
+        sys.exit(1)
+
+def check(args):
+    from aoc2022 import check
+
+    if check.main(args.days, args.budget_scale):
+        sys.exit(1)
+
+def clear_cache(args):
+    from aoc2022.cache import ResultCache
+
+    ResultCache(args.cache_dir).clear()
+
+def add_cache_arguments(parser):
+    parser.add_argument('--cache', action='store_true', help='reuse parsed inputs and answers from earlier runs on the same input')
+    parser.add_argument('--cache-dir', help='cache directory, defaults to $AOC2022_CACHE_DIR or ~/.cache/aoc2022')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='aoc2022', description='Advent of Code 2022 solutions')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='solve a day (or every day) and time each stage')
+    run_parser.add_argument('--day', type=int, choices=list(DAYS), help='day to solve, defaults to all of them')
+    run_parser.add_argument('--part', type=int, choices=[1, 2], help='part to solve, defaults to both')
+    run_parser.add_argument('--input', help="input file, defaults to 'Day N/Day N - input.txt'")
+    run_parser.add_argument('--stream', action='store_true', help='parse the input while reading it instead of loading it all first')
+    run_parser.add_argument('--workers', type=int, help='split the input between this many processes (Day 1 only)')
+    run_parser.add_argument('--profile', action='store_true', help='count calls and time spent in every function of the solution (same as AOC2022_PROFILE=1)')
+    run_parser.add_argument('--profile-output', help='run under cProfile and write the stats to this file (readable with pstats or snakeviz)')
+    add_cache_arguments(run_parser)
+    run_parser.set_defaults(func=run)
+
+    bench_parser = commands.add_parser('bench', help='time every day on generated inputs larger than the puzzle inputs')
+    bench_parser.add_argument('--days', type=int, nargs='+', choices=list(DAYS), help='days to benchmark, defaults to all of them')
+    bench_parser.add_argument('--scale', type=int, default=10, help='how many times bigger than the puzzle input (default 10)')
+    bench_parser.add_argument('--seed', type=int, default=2022, help='seed for the input generators')
+    bench_parser.add_argument('--timeout', type=float, default=600, help='seconds before a day is given up on (default 600)')
+    bench_parser.add_argument('--output', default='benchmarks.jsonl', help='JSON lines file the results are appended to')
+    bench_parser.set_defaults(func=bench)
+
+    batch_parser = commands.add_parser('batch', help='solve many inputs in parallel, defaults to every day with its own input')
+    batch_parser.add_argument('--day', type=int, choices=list(DAYS), help='day the input files belong to, or the one day to solve with its own input')
+    batch_parser.add_argument('--workers', type=int, help='worker processes, defaults to the number of CPUs')
+    batch_parser.add_argument('inputs', nargs='*', help='input files to solve')
+    add_cache_arguments(batch_parser)
+    batch_parser.set_defaults(func=batch)
+
+    check_parser = commands.add_parser('check', help='check every day against its examples and its input, within a time budget')
+    check_parser.add_argument('--days', type=int, nargs='+', choices=list(DAYS), help='days to check, defaults to all of them')
+    check_parser.add_argument('--budget-scale', type=float, default=1.0, help='multiply every time budget by this (e.g. on a slow machine)')
+    check_parser.set_defaults(func=check)
+
+    clear_parser = commands.add_parser('clear-cache', help='remove everything from the result cache')
+    clear_parser.add_argument('--cache-dir', help='cache directory, defaults to $AOC2022_CACHE_DIR or ~/.cache/aoc2022')
+    clear_parser.set_defaults(func=clear_cache)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+""" Solves many inputs at once across a pool of worker processes.
+
+Workers import the day scripts they need when they start and keep them for every job they are
+given (see aoc2022.load), so a batch of hundreds of files only pays for interpreter startup and
+imports once per worker. """
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from aoc2022 import DAYS, input_path, load, read_input, solve
+
+_cache = None
+
+def _preload(days, cache_dir):
+    global _cache
+    for day in days:
+        load(day)
+    if cache_dir is not None:
+        from aoc2022.cache import ResultCache
+        _cache = ResultCache(cache_dir)
+
+def solve_file(day, path):
+    start = time.perf_counter()
+    try:
+        text = read_input(day, path)
+        answers = _cache.solve(day, text) if _cache is not None else solve(day, text)
+        error = None
+    except Exception as e:
+        answers = None
+        error = repr(e)
+    return day, path, answers, error, time.perf_counter() - start
+
+# cache_dir turns on the result cache in every worker (see aoc2022.cache)
+def run_batch(jobs, workers=None, cache_dir=None):
+    days = sorted(set(day for day, path in jobs))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_preload, initargs=(days, cache_dir)) as executor:
+        futures = [executor.submit(solve_file, day, path) for day, path in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+def format_result(day, path, answers, error, seconds):
+    name = os.path.relpath(path)
+    if name.startswith('..'):
+        name = path
+    line = 'Day {:<3} {:>9.3f}s  {}  '.format(day, seconds, name)
+    if error:
+        return line + 'error: ' + error
+    # Keep one line per input, Day 10 part 2 draws a whole screen
+    return line + '  '.join(repr(answer) if '\n' in str(answer) else str(answer) for answer in answers)
+
+def main(jobs=None, workers=None, cache_dir=None):
+    if not jobs:
+        jobs = [(day, input_path(day)) for day in DAYS]
+
+    start = time.perf_counter()
+    failed = 0
+    for result in run_batch(jobs, workers, cache_dir):
+        print(format_result(*result), flush=True)
+        if result[3]:
+            failed += 1
+    print('{} inputs in {:.3f}s, {} failed'.format(len(jobs), time.perf_counter() - start, failed))
+    return failed
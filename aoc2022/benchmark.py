@@ -0,0 +1,102 @@
+""" Benchmarks every day's solution against synthetic inputs much larger than the puzzle inputs.
+
+Each case runs in a fresh child process so its peak RSS is its own, and results are appended as
+one JSON object per line to a history file. Each record carries the git commit, so running the
+benchmarks on successive commits makes regressions in the hot paths easy to spot. """
+
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import subprocess
+import tempfile
+import time
+
+from aoc2022 import DAYS, ROOT
+from aoc2022.generate import GENERATORS
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+def _child(day, path, conn):
+    from aoc2022.runner import run_day
+
+    try:
+        answers, timings = run_day(day, path)
+        # ru_maxrss is in kilobytes on Linux but bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if platform.system() == 'Darwin':
+            peak //= 1024
+        conn.send(('ok', timings, peak))
+    except Exception as e:
+        conn.send(('error', repr(e), None))
+    conn.close()
+
+def run_case(day, path, timeout):
+    ctx = multiprocessing.get_context('spawn')
+    parent, child = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_child, args=(day, path, child))
+    process.start()
+    child.close()
+
+    if parent.poll(timeout):
+        try:
+            result = parent.recv()
+        except EOFError:
+            result = ('crashed', None, None)
+    else:
+        process.terminate()
+        result = ('timeout', None, None)
+    process.join()
+    return result
+
+def benchmark(days=None, scale=10, seed=2022, timeout=600):
+    commit = git_commit()
+
+    for day in days or list(DAYS):
+        text = GENERATORS[day](scale, random.Random(seed))
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write(text)
+        try:
+            status, timings, peak = run_case(day, f.name, timeout)
+        finally:
+            os.remove(f.name)
+
+        record = {
+            'commit': commit,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'day': day,
+            'scale': scale,
+            'seed': seed,
+            'input_bytes': len(text.encode()),
+            'status': status,
+        }
+        if status == 'ok':
+            solve_time = timings['parse'] + timings['part 1'] + timings['part 2']
+            record['seconds'] = timings
+            record['mb_per_second'] = record['input_bytes'] / 1e6 / solve_time if solve_time else None
+            record['peak_rss_kb'] = peak
+        elif status == 'error':
+            record['error'] = timings
+        yield record
+
+def format_record(record):
+    line = 'Day {:<3} x{:<5} {:>10} bytes  '.format(record['day'], record['scale'], record['input_bytes'])
+    if record['status'] != 'ok':
+        return line + record['status'] + (': ' + record['error'] if 'error' in record else '')
+    seconds = record['seconds']
+    return line + 'parse {:.3f}s  part 1 {:.3f}s  part 2 {:.3f}s  {:.2f} MB/s  peak RSS {} KB'.format(
+        seconds['parse'], seconds['part 1'], seconds['part 2'], record['mb_per_second'] or 0, record['peak_rss_kb'])
+
+def main(days=None, scale=10, seed=2022, timeout=600, output='benchmarks.jsonl'):
+    with open(output, 'a') as f:
+        for record in benchmark(days, scale, seed, timeout):
+            print(format_record(record), flush=True)
+            f.write(json.dumps(record) + '\n')
+            f.flush()
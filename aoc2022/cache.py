@@ -0,0 +1,99 @@
+""" On-disk cache of parsed inputs and answers.
+
+Entries are keyed by the SHA-256 of the input text together with the version of the day's script
+(see aoc2022.version), so editing a solution never serves stale answers. Answers and parsed
+inputs are stored as separate pickles: answers are tiny and are all a repeated run needs, while
+the parsed input saves re-parsing when only one part has been solved before.
+
+Every hit touches the file, and once the directory grows past its size cap the least recently
+used files are removed first. """
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+from aoc2022 import load, version
+
+DEFAULT_DIR = os.environ.get('AOC2022_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'aoc2022')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+class ResultCache:
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory or DEFAULT_DIR
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, day, text):
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        return 'day{}-{}-{}'.format(day, version(day)[:16], digest)
+
+    def _path(self, key, kind):
+        return os.path.join(self.directory, key + '.' + kind + '.pickle')
+
+    def get(self, key, kind):
+        path = self._path(key, kind)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+            os.utime(path)
+            return value
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def put(self, key, kind, value):
+        # Write then rename so other processes never read a half written entry
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self._path(key, kind))
+        self.evict()
+
+    def entries(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.pickle'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+        return entries
+
+    def evict(self):
+        entries = sorted(self.entries())
+        total = sum(size for mtime, size, name in entries)
+        for mtime, size, name in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        for mtime, size, name in self.entries():
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def solve(self, day, text, parts=(1, 2)):
+        key = self.key(day, text)
+        answers = self.get(key, 'answers') or {}
+        missing = [part for part in parts if part not in answers]
+
+        if missing:
+            module = load(day)
+            parsed = self.get(key, 'parsed')
+            if parsed is None:
+                parsed = module.parse(text)
+                self.put(key, 'parsed', parsed)
+            solvers = {1: module.part1, 2: module.part2}
+            for part in missing:
+                answers[part] = solvers[part](parsed)
+            self.put(key, 'answers', answers)
+
+        return [answers[part] for part in parts]
@@ -0,0 +1,333 @@
+""" Regression checks: every day against the examples in its puzzle text and against its committed
+input, with a time budget for the committed inputs.
+
+The examples are cut straight out of each script's puzzle text: the line that introduces an
+example and how many lines it runs for are enough to find it. The expected answers come from the
+puzzle text and from the `# Ans` comments in each script's main().
+
+Days with more than one way to the same result also get a parity check. The NumPy paths of Days 1
+to 4, Day 4's index and Day 5's engines and replay only run on inputs far bigger than the ones
+here, so instead they are run directly and compared with the plain Python path (or a brute force
+one) on the examples, the committed input and a generated input, also with Windows line endings.
+The same inputs read a line at a time from a file, as `run --stream` does, have to give the same
+answers as parse().
+
+    python -m aoc2022 check
+    python -m aoc2022 check --days 8 9 12 14 --budget-scale 2
+"""
+
+import os
+import random
+import string
+import tempfile
+import time
+from array import array
+
+from aoc2022 import DAYS, load, read_input, script_path
+from aoc2022.generate import GENERATORS
+from aoc2022.reader import parse_file
+
+# Day 10 part 2 draws letters on the CRT, so its answers are the rows of the screen
+EXAMPLE_SCREEN = [
+    '##..##..##..##..##..##..##..##..##..##..',
+    '###...###...###...###...###...###...###.',
+    '####....####....####....####....####....',
+    '#####.....#####.....#####.....#####.....',
+    '######......######......######......####',
+    '#######.......#######.......#######.....',
+]
+
+INPUT_SCREEN = [
+    '####.###....##.###..###..#..#..##..#..#.',
+    '#....#..#....#.#..#.#..#.#.#..#..#.#..#.',
+    '###..#..#....#.###..#..#.##...#..#.####.',
+    '#....###.....#.#..#.###..#.#..####.#..#.',
+    '#....#....#..#.#..#.#.#..#.#..#..#.#..#.',
+    '####.#.....##..###..#..#.#..#.#..#.#..#.',
+]
+
+# Day -> list of (line introducing the example, number of lines, part 1 answer, part 2 answer,
+# extra arguments for the parts). An answer of None isn't given by the puzzle text.
+EXAMPLES = {
+    1: [('end up with the following list:', 14, 24000, 45000, {})],
+    2: [('following strategy guide:', 3, 15, 12, {})],
+    3: [('from six rucksacks:', 6, 157, 70, {})],
+    4: [('section assignment pairs:', 6, 2, 4, {})],
+    5: [('For example:', 9, 'CMZ', 'MCD', {})],
+    6: [('following datastream buffer:', 1, 7, 19, {})],
+    7: [('For example:', 23, 95437, 24933642, {})],
+    8: [('For example:', 5, 21, 8, {})],
+    9: [('For example:', 8, 13, 1, {}),
+        ("Here's a larger example:", 8, None, 36, {})],
+    10: [('consider this larger program:', 146, 13140, EXAMPLE_SCREEN, {})],
+    11: [('For example:', 27, 10605, 2713310158, {})],
+    12: [('For example:', 5, 31, 29, {})],
+    13: [('For example:', 23, 13, 140, {})],
+    14: [('For example:', 2, 24, 93, {})],
+    15: [('For example:', 14, 26, 56000011, {1: {'y': 10}, 2: {'limit': 20}})],
+}
+
+ANSWERS = {
+    1: (69836, 207968),
+    2: (13268, 15508),
+    3: (8515, 2434),
+    4: (431, 823),
+    5: ('TLFGBZHCN', 'QRQFHFWCL'),
+    6: (1093, 3534),
+    7: (1915606, 5025657),
+    8: (1854, 527340),
+    9: (5695, 2434),
+    10: (11820, INPUT_SCREEN),
+    11: (101436, 19754471646),
+    12: (350, 349),
+    13: (6369, 25800),
+    14: (832, 27601),
+    15: (5127797, 12518502636475),
+}
+
+# Seconds allowed to parse and solve both parts of the committed input. Generous on purpose,
+# they are there to catch a solution getting several times slower, not to measure it.
+DEFAULT_BUDGET = 1.0
+BUDGETS = {
+    11: 5.0,
+    12: 20.0,
+    14: 60.0,
+    15: 10.0,
+}
+
+def example(day, marker, length):
+    with open(script_path(day)) as f:
+        lines = f.read().split('\n')
+    start = next(n for n, line in enumerate(lines) if marker in line) + 1
+    while lines[start] == '':
+        start += 1
+    return '\n'.join(lines[start:start + length]) + '\n'
+
+def normalise(answer):
+    if isinstance(answer, str) and '\n' in answer:
+        return [row for row in answer.split('\n') if len(row) == 40]
+    return answer
+
+def solve(day, text, options):
+    module = load(day)
+    start = time.perf_counter()
+    parsed = module.parse(text)
+    answers = (module.part1(parsed, **options.get(1, {})), module.part2(parsed, **options.get(2, {})))
+    return [normalise(answer) for answer in answers], time.perf_counter() - start
+
+def compare(answers, expected):
+    problems = []
+    for part, (answer, want) in enumerate(zip(answers, expected), 1):
+        if want is not None and answer != want:
+            problems.append('part {} gave {!r}, expected {!r}'.format(part, answer, want))
+    return problems
+
+# (name, text) for every input a parity check tries
+def parity_inputs(day):
+    texts = [('example ' + str(n), example(day, marker, length))
+             for n, (marker, length, part1, part2, options) in enumerate(EXAMPLES.get(day, []), 1)]
+    texts.append(('input', read_input(day)))
+    texts.append(('generated input', GENERATORS[day](1, random.Random(day))))
+    return texts
+
+def line_endings(texts):
+    for name, text in texts:
+        yield name, text
+        yield name + ' with \\r\\n', text.replace('\n', '\r\n')
+        yield name + ' without the last newline', text.rstrip('\n')
+
+# parse_bytes against the day's Python path. What they parse to can differ in type (Day 2 counts
+# rounds in a Counter on one and a dict on the other), so it's the answers that are compared.
+def same_as_bytes(python_path):
+    def check_bytes(module, texts):
+        problems = []
+        for name, text in line_endings(texts):
+            want = answers(module, python_path(module, text))
+            got = answers(module, module.parse_bytes(text.encode()))
+            if got != want:
+                problems.append('{}: parse_bytes gave {!r}, the Python path {!r}'.format(name, got, want))
+        return problems
+    return check_bytes
+
+# parse_file reading the input a line at a time, as `run --stream` does, against parse()
+def same_as_stream(day):
+    def check_stream(module, texts):
+        problems = []
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'input.txt')
+            for name, text in line_endings(texts):
+                with open(path, 'w', newline='') as f:
+                    f.write(text)
+                want = answers(module, module.parse(text))
+                got = answers(module, parse_file(day, path))
+                if got != want:
+                    problems.append('{}: parse_file gave {!r}, parse {!r}'.format(name, got, want))
+        return problems
+    return check_stream
+
+# Another check with blank lines put in, as `new` in place of every `old`
+def with_blank_lines(check, old, new):
+    def check_blank_lines(module, texts):
+        return check(module, [(name + ' with blank lines', text.replace(old, new)) for name, text in texts])
+    return check_blank_lines
+
+def answers(module, parsed):
+    return module.part1(parsed), module.part2(parsed)
+
+def day1_groups(module, text):
+    return module.parse_groups(module.groups(text.splitlines()))
+
+def python_lines(module, text):
+    return module.parse_lines(text.splitlines())
+
+# Day 4's index against going through every elf for every query
+def day4_index(module, texts):
+    problems = []
+    for name, text in texts:
+        ranges = list(module.assignments(text.splitlines()))
+        if module.read_pairs(text.encode()).reshape(-1, 2).tolist() != [list(r) for r in ranges]:
+            problems.append('{}: read_pairs and assignments give different ranges'.format(name))
+
+        index = module.build_index(ranges)
+        top = max(id_max for id_min, id_max in ranges)
+        for id_min in range(0, top + 2, 3):
+            for id_max in range(id_min, top + 2, 5):
+                want = [elf for elf, (low, high) in enumerate(ranges, 1) if low <= id_max and id_min <= high]
+                if module.overlapping(index, id_min, id_max) != want or module.count_overlapping(index, id_min, id_max) != len(want):
+                    problems.append('{}: wrong elves overlapping {}-{}'.format(name, id_min, id_max))
+                    break
+
+        covered = [sum(low <= section <= high for low, high in ranges) for section in range(top + 1)]
+        section, elves = index.most_covered
+        if elves != max(covered) or covered[section] != elves:
+            problems.append('{}: most covered section is {!r}, expected {} elves'.format(name, index.most_covered, max(covered)))
+    return problems
+
+# Day 5 the way it was first solved, a crate at a time for the CrateMover 9000
+def crate_by_crate(stacks, moves, reverse):
+    for n in range(0, len(moves), 3):
+        times, fr, to = moves[n:n + 3]
+        if reverse:
+            for _ in range(times):
+                stacks[to-1].append(stacks[fr-1].pop())
+        else:
+            crates = stacks[fr-1][len(stacks[fr-1]) - times:]
+            del stacks[fr-1][len(stacks[fr-1]) - times:]
+            stacks[to-1].extend(crates)
+    return stacks
+
+# Workloads the generator never makes: moves of no crates, of whole stacks and onto the same stack
+def day5_workloads(rng, count):
+    for _ in range(count):
+        stacks = [[rng.choice(string.ascii_uppercase) for _ in range(rng.randint(0, 20))] for _ in range(rng.randint(1, 5))]
+        heights = [len(stack) for stack in stacks]
+        moves = array('q')
+        for _ in range(rng.randint(0, 50)):
+            fr = rng.randrange(len(stacks))
+            to = rng.randrange(len(stacks))
+            times = rng.randint(0, heights[fr])
+            heights[fr] -= times
+            heights[to] += times
+            moves.extend((times, fr + 1, to + 1))
+        yield stacks, moves
+
+def day5_parsed(module, texts):
+    for name, text in line_endings(texts):
+        parsed = module.parse(text)
+        # The blank line after the drawing can have spaces on it
+        spaced = text.replace('\n\n', '\n  \n', 1).replace('\r\n\r\n', '\r\n  \r\n', 1)
+        if module.parse_lines(text.splitlines()) != parsed or module.parse(spaced) != parsed:
+            yield name, None, 'parse and parse_lines read it differently'
+        yield name, parsed, None
+    for n, parsed in enumerate(day5_workloads(random.Random(5), 200), 1):
+        yield 'workload ' + str(n), parsed, None
+
+# Every engine against the crate by crate answer
+def day5_engines(module, texts):
+    problems = []
+    for name, parsed, problem in day5_parsed(module, texts):
+        if problem:
+            problems.append('{}: {}'.format(name, problem))
+            continue
+        stacks, moves = parsed
+        for part, reverse in ((1, True), (2, False)):
+            want = ''.join(stack[-1] for stack in crate_by_crate([stack.copy() for stack in stacks], moves, reverse) if stack)
+            for method in module.SOLVERS:
+                got = module.solve(parsed, reverse, method)
+                if got != want:
+                    problems.append('{}: part {} with {!r} gave {!r}, expected {!r}'.format(name, part, method, got, want))
+    return problems
+
+# state_after every move against moving the crates one move at a time from the start
+def day5_replay(module, texts):
+    problems = []
+    for name, parsed, problem in day5_parsed(module, texts):
+        if problem:
+            continue
+        stacks, moves = parsed
+        for part, reverse in ((1, True), (2, False)):
+            for every in (None, 1, 7):
+                checkpoints = module.replay(parsed, reverse, every)
+                want = [stack.copy() for stack in stacks]
+                for k in range(len(moves) // 3 + 1):
+                    if k:
+                        crate_by_crate(want, moves[3 * k - 3:3 * k], reverse)
+                    if module.state_after(checkpoints, k) != want:
+                        problems.append('{}: part {} stacks after {} moves (every={}) are wrong'.format(name, part, k, every))
+                        break
+    return problems
+
+# Day -> checks taking the day's module and parity_inputs(day), each returning a list of problems
+PARITY = {
+    # Blank lines between Day 1's groups can come in runs and have spaces on them, and Day 3's
+    # blank lines belong to no group
+    1: [same_as_bytes(day1_groups), same_as_stream(1),
+        with_blank_lines(same_as_bytes(day1_groups), '\n\n', '\n \n\t\n'),
+        with_blank_lines(same_as_stream(1), '\n\n', '\n \n\t\n')],
+    2: [same_as_bytes(python_lines), same_as_stream(2)],
+    3: [same_as_bytes(python_lines), same_as_stream(3), with_blank_lines(same_as_bytes(python_lines), '\n', '\n\n')],
+    4: [same_as_bytes(python_lines), same_as_stream(4), day4_index],
+    5: [same_as_stream(5), day5_engines, day5_replay],
+    # parse_file maps Day 8's grid with aoc2022.grid.load_grid
+    8: [same_as_stream(8)],
+}
+
+def check(days=None, budget_scale=1.0):
+    for day in days or list(DAYS):
+        for n, (marker, length, part1, part2, options) in enumerate(EXAMPLES.get(day, []), 1):
+            try:
+                answers, seconds = solve(day, example(day, marker, length), options)
+                problems = compare(answers, (part1, part2))
+            except Exception as e:
+                seconds, problems = 0.0, [repr(e)]
+            yield day, 'example ' + str(n), seconds, problems
+
+        budget = BUDGETS.get(day, DEFAULT_BUDGET) * budget_scale
+        try:
+            answers, seconds = solve(day, read_input(day), {})
+            problems = compare(answers, ANSWERS[day])
+        except Exception as e:
+            seconds, problems = 0.0, [repr(e)]
+        if seconds > budget:
+            problems.append('took {:.3f}s, budget is {:.3f}s'.format(seconds, budget))
+        yield day, 'input', seconds, problems
+
+        if day in PARITY:
+            start = time.perf_counter()
+            try:
+                texts = parity_inputs(day)
+                problems = [problem for parity in PARITY[day] for problem in parity(load(day), texts)]
+            except Exception as e:
+                problems = [repr(e)]
+            yield day, 'parity', time.perf_counter() - start, problems
+
+def main(days=None, budget_scale=1.0):
+    failed = 0
+    for day, case, seconds, problems in check(days, budget_scale):
+        print('Day {:<3} {:<10} {:>9.3f}s  {}'.format(day, case, seconds, 'FAIL' if problems else 'ok'), flush=True)
+        for problem in problems:
+            print('    ' + problem)
+        if problems:
+            failed += 1
+    print('all checks passed' if not failed else '{} checks failed'.format(failed))
+    return failed
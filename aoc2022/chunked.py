@@ -0,0 +1,57 @@
+""" Parses one large input across several worker processes.
+
+The file is cut into byte ranges that each end on a blank line, so no group of lines is split
+between two workers. Every worker reads and parses only its own range with the day's parse(), and
+the day's merge() combines what they return. Only days whose records are blank line separated
+groups, and whose parsed results can be combined, have a merge() (Day 1). """
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc2022 import load
+
+# Below this a single process is faster than starting the workers
+MIN_CHUNK_BYTES = 1024 * 1024
+
+def boundaries(path, chunks):
+    size = os.path.getsize(path)
+    offsets = [0]
+    with open(path, 'rb') as f:
+        for n in range(1, chunks):
+            target = max(size * n // chunks, offsets[-1])
+            if target >= size:
+                break
+            # Finish the line the target falls in, then stop after the next blank line
+            f.seek(max(target - 1, 0))
+            f.readline()
+            while True:
+                line = f.readline()
+                if not line or line.strip() == b'':
+                    break
+            if f.tell() >= size:
+                break
+            if f.tell() > offsets[-1]:
+                offsets.append(f.tell())
+    offsets.append(size)
+    return list(zip(offsets, offsets[1:]))
+
+def parse_chunk(day, path, start, end):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode().replace('\r\n', '\n')
+    return load(day).parse(text)
+
+def parse_parallel(day, path, workers=None):
+    module = load(day)
+    if not hasattr(module, 'merge'):
+        raise ValueError('Day {} can not be parsed in chunks, its script has no merge()'.format(day))
+
+    workers = workers or os.cpu_count() or 1
+    chunks = min(workers, max(1, os.path.getsize(path) // MIN_CHUNK_BYTES))
+    ranges = boundaries(path, chunks)
+    if len(ranges) == 1:
+        return parse_chunk(day, path, *ranges[0])
+
+    with ProcessPoolExecutor(max_workers=len(ranges), initializer=load, initargs=(day,)) as executor:
+        futures = [executor.submit(parse_chunk, day, path, start, end) for start, end in ranges]
+        return module.merge([future.result() for future in futures])
@@ -0,0 +1,231 @@
+""" Synthetic puzzle inputs for benchmarking.
+
+Each generator takes a scale factor and a random.Random and returns the text of an input that
+follows the same format as the real puzzle input, roughly `scale` times its size. Grids grow by
+`scale` in area, so their sides grow by sqrt(scale). """
+
+import math
+import string
+
+LETTERS = string.ascii_lowercase + string.ascii_uppercase
+
+def day1(scale, rng):
+    groups = []
+    for _ in range(250 * scale):
+        groups.append('\n'.join(str(rng.randint(1000, 70000)) for _ in range(rng.randint(1, 15))))
+    return '\n\n'.join(groups) + '\n'
+
+def day2(scale, rng):
+    return ''.join(rng.choice('ABC') + ' ' + rng.choice('XYZ') + '\n' for _ in range(2500 * scale))
+
+# Each rucksack in a group draws from its own third of the letters, split again between its
+# compartments, so the shared item and the badge are the only item types in common.
+def day3(scale, rng):
+    lines = []
+    for _ in range(100 * scale):
+        badge = rng.choice(LETTERS)
+        others = [letter for letter in LETTERS if letter != badge]
+        rng.shuffle(others)
+        for third in (others[0:17], others[17:34], others[34:51]):
+            left_items, right_items = third[:8], third[8:]
+            shared = rng.choice(left_items)
+            half = rng.randint(4, 24)
+            left = [rng.choice(left_items) for _ in range(half - 1)] + [shared]
+            right = [rng.choice(right_items) for _ in range(half - 2)] + [shared, badge]
+            rng.shuffle(left)
+            rng.shuffle(right)
+            lines.append(''.join(left + right))
+    return '\n'.join(lines) + '\n'
+
+def day4(scale, rng):
+    lines = []
+    for _ in range(1000 * scale):
+        a = rng.randint(1, 99)
+        b = rng.randint(a, 99)
+        c = rng.randint(1, 99)
+        d = rng.randint(c, 99)
+        lines.append('{}-{},{}-{}'.format(a, b, c, d))
+    return '\n'.join(lines) + '\n'
+
+def day5(scale, rng):
+    stacks = [[rng.choice(string.ascii_uppercase) for _ in range(8)] for _ in range(9)]
+    diagram = []
+    for level in range(7, -1, -1):
+        diagram.append(' '.join('[' + stack[level] + ']' for stack in stacks))
+    diagram.append(' ' + '   '.join(str(n) for n in range(1, 10)) + ' ')
+
+    sizes = [8] * 9
+    moves = []
+    for _ in range(500 * scale):
+        fr = rng.choice([i for i in range(9) if sizes[i] > 1])
+        to = rng.choice([i for i in range(9) if i != fr])
+        times = rng.randint(1, sizes[fr] - 1)
+        sizes[fr] -= times
+        sizes[to] += times
+        moves.append('move {} from {} to {}'.format(times, fr + 1, to + 1))
+    return '\n'.join(diagram) + '\n\n' + '\n'.join(moves) + '\n'
+
+# A long run over three letters can't contain either marker, so the solvers have to scan the whole
+# stream before the markers at the very end.
+def day6(scale, rng):
+    return ''.join(rng.choice('abc') for _ in range(4000 * scale)) + 'defghijklmnopq\n'
+
+def day7(scale, rng):
+    lines = ['$ cd /']
+    counter = [0]
+
+    def directory(depth):
+        lines.append('$ ls')
+        subdirs = []
+        for _ in range(rng.randint(1, 6)):
+            counter[0] += 1
+            lines.append('{} f{}.txt'.format(rng.randint(1000, 300000), counter[0]))
+        if depth < 8:
+            for _ in range(rng.randint(0, 3)):
+                counter[0] += 1
+                subdirs.append('d' + str(counter[0]))
+                lines.append('dir ' + subdirs[-1])
+        for name in subdirs:
+            lines.append('$ cd ' + name)
+            directory(depth + 1)
+            lines.append('$ cd ..')
+
+    while len(lines) < 1000 * scale:
+        counter[0] += 1
+        lines.append('$ cd top' + str(counter[0]))
+        directory(1)
+        lines.append('$ cd ..')
+
+    # The solver files whatever was listed last under the final working directory, so like the
+    # real input the log has to end inside a folder rather than back at the root
+    while lines[-1] == '$ cd ..':
+        lines.pop()
+
+    # The root listing only needs the folders created above
+    tops = ['dir ' + line[5:] for line in lines if line.startswith('$ cd top')]
+    return '\n'.join(lines[:1] + ['$ ls'] + tops + lines[1:]) + '\n'
+
+def day8(scale, rng):
+    side = int(99 * math.sqrt(scale))
+    return ''.join(''.join(rng.choice('0123456789') for _ in range(side)) + '\n' for _ in range(side))
+
+def day9(scale, rng):
+    return ''.join(rng.choice('UDLR') + ' ' + str(rng.randint(1, 20)) + '\n' for _ in range(2000 * scale))
+
+def day10(scale, rng):
+    lines = []
+    x = 1
+    for _ in range(140 * scale):
+        if rng.random() < 0.3:
+            lines.append('noop')
+        else:
+            change = rng.randint(-5, 5)
+            # Keep the sprite somewhere near the screen
+            if not -5 < x + change < 45:
+                change = -change
+            x += change
+            lines.append('addx ' + str(change))
+    return '\n'.join(lines) + '\n'
+
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97]
+
+def day11(scale, rng):
+    n = max(2, min(len(PRIMES), 8 * int(math.sqrt(scale))))
+    blocks = []
+    for index in range(n):
+        items = ', '.join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8) * max(1, int(math.sqrt(scale)))))
+        # Squaring on every other monkey makes part 1 worry levels (which are never reduced
+        # modulo anything) millions of digits long, so 'old' only appears as a doubling
+        op = rng.choice(['+ old', '* ' + str(rng.randint(2, 19)), '+ ' + str(rng.randint(1, 8))])
+        others = [i for i in range(n) if i != index]
+        blocks.append('\n'.join([
+            'Monkey {}:'.format(index),
+            '  Starting items: ' + items,
+            '  Operation: new = old ' + op,
+            '  Test: divisible by ' + str(PRIMES[index]),
+            '    If true: throw to monkey ' + str(rng.choice(others)),
+            '    If false: throw to monkey ' + str(rng.choice(others)),
+        ]))
+    return '\n\n'.join(blocks) + '\n'
+
+# Heights climb slowly from left to right, with random dips everywhere except the middle row so
+# E (far right) is always reachable from S. Only the first column is at elevation a, like the
+# real input.
+def day12(scale, rng):
+    rows = int(41 * math.sqrt(scale))
+    cols = int(172 * math.sqrt(scale))
+    grid = []
+    for row in range(rows):
+        line = ['a']
+        for col in range(1, cols):
+            height = 1 + (col * 25) // cols
+            if row != rows // 2 and rng.random() < 0.2:
+                height = rng.randint(1, height)
+            line.append(chr(ord('a') + height))
+        grid.append(line)
+    grid[rows // 2][0] = 'S'
+    grid[rows // 2][cols - 1] = 'E'
+    return '\n'.join(''.join(line) for line in grid) + '\n'
+
+def day13(scale, rng):
+    def packet(depth):
+        items = []
+        for _ in range(rng.randint(0, 5)):
+            if depth < 4 and rng.random() < 0.3:
+                items.append(packet(depth + 1))
+            else:
+                items.append(rng.randint(0, 10))
+        return items
+
+    pairs = []
+    for _ in range(150 * scale):
+        pairs.append(str(packet(0)).replace(' ', '') + '\n' + str(packet(0)).replace(' ', ''))
+    return '\n\n'.join(pairs) + '\n'
+
+def day14(scale, rng):
+    width = int(70 * math.sqrt(scale))
+    depth = int(170 * math.sqrt(scale))
+    lines = []
+    for _ in range(150 * scale):
+        x = rng.randint(500 - width, 500 + width)
+        y = rng.randint(13, depth)
+        points = [(x, y)]
+        for _ in range(rng.randint(1, 4)):
+            if len(points) % 2:
+                x = min(500 + width, max(500 - width, x + rng.randint(-6, 6)))
+            else:
+                y = min(depth, max(13, y + rng.randint(-6, 6)))
+            points.append((x, y))
+        lines.append(' -> '.join('{},{}'.format(x, y) for x, y in points))
+    return '\n'.join(lines) + '\n'
+
+# The first sensor sits on x=0 so the scanned row starts left of zero, as the Day 15 solver expects.
+def day15(scale, rng):
+    lines = []
+    for n in range(30 * scale):
+        sensor_x = 0 if n == 0 else rng.randint(0, 4000000)
+        sensor_y = rng.randint(0, 4000000)
+        beacon_x = sensor_x + rng.randint(-800000, 800000)
+        beacon_y = sensor_y + rng.randint(-800000, 800000)
+        if beacon_y == 2000000:
+            beacon_y += 1
+        lines.append('Sensor at x={}, y={}: closest beacon is at x={}, y={}'.format(sensor_x, sensor_y, beacon_x, beacon_y))
+    return '\n'.join(lines) + '\n'
+
+GENERATORS = {
+    1: day1,
+    2: day2,
+    3: day3,
+    4: day4,
+    5: day5,
+    6: day6,
+    7: day7,
+    8: day8,
+    9: day9,
+    10: day10,
+    11: day11,
+    12: day12,
+    13: day13,
+    14: day14,
+    15: day15,
+}
@@ -0,0 +1,40 @@
+""" Memory-mapped loader for grid shaped inputs (Days 8 and 12).
+
+The file is mapped rather than read, and the grid is a 2D uint8 view straight onto the mapping:
+each row starts one line length plus the line ending further on, so the line endings are simply
+stepped over. Loading only reads through the file once, to check that the line endings are all
+where a grid's would be, and the grid takes no more memory than the file itself. """
+
+import mmap
+
+import numpy as np
+
+def load_grid(path):
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            raise ValueError('{} is empty'.format(path))
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    buffer = np.frombuffer(data, dtype=np.uint8)
+
+    newline = data.find(b'\n')
+    if newline == -1:
+        return buffer.reshape(1, -1)
+    width = newline - 1 if newline > 0 and buffer[newline - 1] == ord('\r') else newline
+    stride = newline + 1
+
+    # The last line may or may not end with a line ending
+    size = len(buffer)
+    while size > 0 and buffer[size - 1] in (ord('\n'), ord('\r')):
+        size -= 1
+    rows = (size + stride - width) // stride
+    if size != (rows - 1) * stride + width:
+        raise ValueError('{} is not a grid, its lines are not all {} characters wide'.format(path, width))
+
+    # Every row has to be followed by the same line ending, and there can't be any others: short
+    # lines adding up to a whole row would otherwise put their line endings inside the grid
+    endings = buffer[width:size:stride]
+    breaks = np.count_nonzero(buffer[:size] == ord('\n')) + np.count_nonzero(buffer[:size] == ord('\r'))
+    if not (endings == buffer[width]).all() or breaks != (rows - 1) * (stride - width):
+        raise ValueError('{} is not a grid, its lines are not all {} characters wide'.format(path, width))
+
+    return np.lib.stride_tricks.as_strided(buffer, shape=(rows, width), strides=(stride, 1), writeable=False)
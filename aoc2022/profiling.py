@@ -0,0 +1,67 @@
+""" Opt-in call counters for the functions in each day's script.
+
+With AOC2022_PROFILE set in the environment (or `python -m aoc2022 run --profile`), every function
+a day's script defines is wrapped when the registry loads it. The solutions call their helpers
+through the module's globals, so the wrappers see every call to calculateTailPos, compare_order,
+check_south, calculate_worry and the rest without any change to the scripts. Functions kept in a
+module level dict are swapped for their wrappers too. Any other reference taken while the script
+ran (a default argument, a closure, a list) still calls the unwrapped function and isn't counted.
+
+Cumulative time is only counted for the outermost call of a function, so recursive functions
+like compare_order aren't counted twice. Times include the wrappers' own overhead, so compare
+them with each other rather than with unprofiled runs. For a full profile use cProfile instead,
+e.g. `python -m aoc2022 run --day 13 --profile-output day13.pstats`. """
+
+import functools
+import os
+import time
+import types
+
+ENV = 'AOC2022_PROFILE'
+
+# (day, function name) -> [calls, cumulative seconds, calls currently running]
+stats = {}
+
+def enabled():
+    return bool(os.environ.get(ENV))
+
+def _counted(day, name, func):
+    entry = stats.setdefault((day, name), [0, 0.0, 0])
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        entry[0] += 1
+        entry[2] += 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            entry[2] -= 1
+            if entry[2] == 0:
+                entry[1] += time.perf_counter() - start
+
+    return wrapper
+
+def instrument(day, module):
+    wrappers = {}
+    for name, value in list(vars(module).items()):
+        if isinstance(value, types.FunctionType) and value.__module__ == module.__name__ and name != 'main':
+            wrappers[value] = _counted(day, name, value)
+            setattr(module, name, wrappers[value])
+
+    # Tables of functions filled in when the script ran, like Day 5's SOLVERS, still hold the
+    # unwrapped ones
+    for value in list(vars(module).values()):
+        if isinstance(value, dict):
+            for key, item in list(value.items()):
+                if isinstance(item, types.FunctionType) and item in wrappers:
+                    value[key] = wrappers[item]
+
+def report(day):
+    rows = [(name, entry) for (d, name), entry in stats.items() if d == day and entry[0] > 0]
+    rows.sort(key=lambda row: row[1][1], reverse=True)
+
+    lines = ['  {:<24}{:>12}{:>14}{:>14}'.format('function', 'calls', 'cumulative', 'per call')]
+    for name, (calls, seconds, running) in rows:
+        lines.append('  {:<24}{:>12}{:>11.3f} ms{:>11.3f} us'.format(name, calls, seconds * 1000, seconds / calls * 1e6))
+    return '\n'.join(lines)
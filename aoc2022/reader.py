@@ -0,0 +1,57 @@
+""" Streaming input readers.
+
+Instead of reading a whole input into memory, these generators hand lines (or records made of
+lines) to a day's parser one at a time, so the only memory used is whatever the parser keeps.
+
+Every day has a parser for the shape of record it works on:
+
+    parse_lines(lines)    one line at a time (most days)
+    parse_groups(groups)  blank line separated groups, as lists of lines (Days 1 and 11)
+    parse_rows(rows)      rows of a grid, all the same width (Days 8 and 12)
+
+Days 8 and 12 also take the whole grid as an array with parse_grid(grid), and parse_file maps
+those inputs with aoc2022.grid.load_grid instead of reading them line by line. parse_file picks
+the right reader for a day. """
+
+from aoc2022 import load
+
+def lines(path):
+    with open(path) as f:
+        for line in f:
+            yield line.rstrip('\r\n')
+
+def groups(lines):
+    group = []
+    for line in lines:
+        if line.strip() == '':
+            if group:
+                yield group
+            group = []
+        else:
+            group.append(line)
+    # The last group doesn't need a blank line after it
+    if group:
+        yield group
+
+def fixed_width(lines):
+    width = None
+    for n, line in enumerate(lines, 1):
+        if line == '':
+            continue
+        if width is None:
+            width = len(line)
+        elif len(line) != width:
+            raise ValueError('Line {} is {} characters wide, expected {}'.format(n, len(line), width))
+        yield line
+
+def parse_file(day, path):
+    module = load(day)
+    if hasattr(module, 'parse_grid'):
+        from aoc2022.grid import load_grid
+        return module.parse_grid(load_grid(path))
+    elif hasattr(module, 'parse_groups'):
+        return module.parse_groups(groups(lines(path)))
+    elif hasattr(module, 'parse_rows'):
+        return module.parse_rows(fixed_width(lines(path)))
+    else:
+        return module.parse_lines(lines(path))
@@ -0,0 +1,88 @@
+""" Runs a day's solution one stage at a time and records how long each stage took. """
+
+import time
+
+from aoc2022 import input_path, load, read_input
+
+STAGES = ['read', 'cache', 'parse', 'part 1', 'part 2']
+
+# With stream=True the input is fed to the parser line by line instead of being read up front
+# (see aoc2022.reader), and with workers it is split between that many processes (see
+# aoc2022.chunked). Either way the parse time includes reading the file.
+def run_day(day, path=None, parts=(1, 2), cache=None, stream=False, workers=None):
+    module = load(day)
+    timings = {}
+    answers = {}
+
+    if stream or workers:
+        start = time.perf_counter()
+        if workers:
+            from aoc2022.chunked import parse_parallel
+            parsed = parse_parallel(day, path or input_path(day), workers)
+        else:
+            from aoc2022.reader import parse_file
+            parsed = parse_file(day, path or input_path(day))
+        timings['parse'] = time.perf_counter() - start
+        return solve_parts(module, parsed, parts, answers, timings), timings
+
+    start = time.perf_counter()
+    text = read_input(day, path)
+    timings['read'] = time.perf_counter() - start
+
+    if cache is not None:
+        start = time.perf_counter()
+        key = cache.key(day, text)
+        cached = cache.get(key, 'answers') or {}
+        answers = {part: cached[part] for part in parts if part in cached}
+        timings['cache'] = time.perf_counter() - start
+        if len(answers) == len(parts):
+            return answers, timings
+
+    start = time.perf_counter()
+    parsed = cache.get(key, 'parsed') if cache is not None else None
+    fresh = parsed is None
+    if fresh:
+        parsed = module.parse(text)
+    timings['parse'] = time.perf_counter() - start
+
+    solve_parts(module, parsed, parts, answers, timings)
+
+    if cache is not None:
+        if fresh:
+            cache.put(key, 'parsed', parsed)
+        cache.put(key, 'answers', {**cached, **answers})
+
+    return answers, timings
+
+def solve_parts(module, parsed, parts, answers, timings):
+    solvers = {1: module.part1, 2: module.part2}
+    for part in parts:
+        if part in answers:
+            continue
+        start = time.perf_counter()
+        answers[part] = solvers[part](parsed)
+        timings['part ' + str(part)] = time.perf_counter() - start
+    return answers
+
+def format_answer(answer):
+    answer = str(answer)
+    # Day 10 part 2 draws the CRT screen over several lines
+    if '\n' in answer:
+        return '\n' + '\n'.join('    ' + line for line in answer.strip('\n').split('\n'))
+    return '  ' + answer
+
+def report(day, answers, timings):
+    lines = ['Day ' + str(day)]
+    for stage in STAGES:
+        if stage not in timings:
+            continue
+        line = '  {:<8}{:>12.3f} ms'.format(stage, timings[stage] * 1000)
+        if stage.startswith('part'):
+            line += format_answer(answers[int(stage[-1])])
+        lines.append(line)
+    # Parts that came straight from the cache have no time of their own
+    for part in sorted(answers):
+        if 'part ' + str(part) not in timings:
+            lines.append('  {:<8}{:>15}'.format('part ' + str(part), 'cached') + format_answer(answers[part]))
+    lines.append('  {:<8}{:>12.3f} ms'.format('total', sum(timings.values()) * 1000))
+    return '\n'.join(lines)